@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보고서 생성 성능 측정 스크립트
+합성 분석 데이터로 각 보고서 생성기의 생성 시간, 최대 메모리(RSS), 결과 파일 크기를 측정
+
+측정 대상:
+    detailed  excel_generator.ExcelReportGenerator.create_detailed_report
+    original  excel_generator_original.ExcelReportGenerator.create_report
+    website   website_security_analysis.create_security_report
+
+사용 예:
+    python benchmark_report.py --rows 1000 10000 100000 1000000 --json results.json
+    # 이전 버전과 비교 (git show <rev>:path/excel_generator.py > old_generator.py)
+    python benchmark_report.py --rows 10000 --targets detailed --generator old_generator.py --json old.json
+    python benchmark_report.py --rows 10000 --targets detailed --compare old.json
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SEVERITIES = ["HIGH", "MEDIUM", "LOW"]
+VULN_TYPES = ["XSS", "CSRF", "MIXED_CONTENT", "PASSWORD_AUTOCOMPLETE", "INFORMATION_DISCLOSURE"]
+
+# excel_generator_original 의 취약점 설명이 있는 항목 (위험도별)
+LEGACY_VULNERABILITIES = {
+    'high': ['Mixed Content', '민감정보 URL 노출'],
+    'medium': ['콘솔 오류', '민감정보 localStorage 저장'],
+    'low': ['디버깅 정보 노출 가능성', '비밀번호 autocomplete disabled']
+}
+
+DEFAULT_ROWS = [1000, 10000, 100000, 1000000]
+
+
+def generate_findings(count: int) -> List[Dict[str, Any]]:
+    """합성 분석 행 생성 (메뉴별 상세 분석 형식)"""
+    rows = []
+    for i in range(count):
+        vuln_type = VULN_TYPES[i % len(VULN_TYPES)]
+        rows.append({
+            "메뉴": f"메뉴 {i % 50}",
+            "URL": f"https://example.com/menu/{i % 50}/page/{i % 500}",
+            "요소유형": "FORM" if i % 2 else "input",
+            "요소명": f"field_{i}",
+            "파라미터": f"input: field_{i}",
+            "HTTP메소드": "POST" if i % 2 else "GET",
+            "취약점종류": vuln_type,
+            "위험도": SEVERITIES[i % len(SEVERITIES)],
+            "상세설명": "입력값 길이 제한 및 패턴 검증 부재",
+            "패턴": "no_input_validation",
+            "인증필요": "Yes" if i % 3 else "No",
+            "권장조치": "입력값 검증 및 출력값 인코딩 적용"
+        })
+    return rows
+
+
+def generate_page_analysis(count: int) -> Dict[str, Any]:
+    """합성 페이지 분석 결과 생성 (excel_generator_original 형식, 취약점 count 건)"""
+    vulnerabilities = {'high': [], 'medium': [], 'low': []}
+    levels = list(vulnerabilities)
+    for i in range(count):
+        level = levels[i % len(levels)]
+        names = LEGACY_VULNERABILITIES[level]
+        vulnerabilities[level].append(names[(i // len(levels)) % len(names)])
+
+    return {
+        'basic_info': {'url': 'https://example.com', 'title': 'Example', 'domain': 'example.com', 'protocol': 'https:'},
+        'security': {'isHTTPS': True, 'totalMixedContent': 2, 'cspMeta': None},
+        'forms': [{
+            'action': '/login',
+            'method': 'POST',
+            'fields': [
+                {'name': 'username', 'type': 'text', 'required': True},
+                {'name': 'password', 'type': 'password', 'required': True, 'isPassword': True}
+            ],
+            'potentialVulnerabilities': []
+        }],
+        'navigation': {'totalLinks': 15, 'internalLinks': 12, 'externalLinks': 3},
+        'storage': {
+            'cookies': {'count': 1, 'items': [{'name': 'sessionid', 'size': 32}]},
+            'localStorage': {'count': 0, 'totalSize': 0},
+            'sessionStorage': {'count': 0, 'totalSize': 0}
+        },
+        'network': {'total': 25, 'httpsRequests': 23, 'httpRequests': 2},
+        'vulnerabilities': vulnerabilities
+    }
+
+
+def generate_site_analysis(count: int) -> Dict[str, Any]:
+    """합성 사이트 분석 결과 생성 (website_security_analysis 형식, 파일 입력 count 건)"""
+    accepts = ['image/jpeg,image/png,image/jpg', 'application/pdf', 'image/*']
+    return {
+        'basic_info': {
+            'target_url': 'https://example.com',
+            'analysis_date': '2025-01-01 00:00:00',
+            'analyzer': 'benchmark',
+            'page_title': 'Example'
+        },
+        'page_structure': {
+            'main_headings': ['Example'],
+            'navigation_tabs': ['메뉴 1', '메뉴 2'],
+            'main_features': ['기능 1', '기능 2'],
+            'total_buttons': 10,
+            'file_inputs': count
+        },
+        'security_analysis': {
+            'https_enabled': True,
+            'mixed_content': 0,
+            'csp_header': None,
+            'cookies_found': False,
+            'localStorage_empty': True,
+            'sessionStorage_empty': True
+        },
+        'network_analysis': {
+            'total_requests': 10,
+            'successful_requests': 10,
+            'failed_requests': 0,
+            'resource_types': {'document': 1, 'script': 7, 'stylesheet': 1, 'image': 1}
+        },
+        'vulnerability_assessment': {
+            'high_risk': [],
+            'medium_risk': ['CSP(Content Security Policy) 헤더 부재'],
+            'low_risk': ['인라인 스크립트 사용']
+        },
+        'forms_and_inputs': {
+            'total_forms': 0,
+            'file_inputs': [
+                {'accept': accepts[i % len(accepts)], 'multiple': bool(i % 2), 'count': i % 10 + 1}
+                for i in range(count)
+            ]
+        },
+        'privacy_features': {
+            'client_side_processing': True,
+            'no_server_storage': True,
+            'privacy_policy_mentioned': True,
+            'file_auto_deletion': True
+        }
+    }
+
+
+def load_generator(path: str, name: str = "benchmark_target"):
+    """측정 대상 모듈을 경로로 로드"""
+    # 같은 디렉터리의 보조 모듈(findings_table 등) import 허용
+    module_dir = os.path.dirname(os.path.abspath(path))
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run_detailed(path: str, rows: int, output: str, streaming: bool):
+    module = load_generator(path)
+    data = generate_findings(rows)
+    kwargs = {'streaming': True} if streaming else {}
+    return lambda: module.ExcelReportGenerator(data).create_detailed_report(output, **kwargs)
+
+
+def _run_original(path: str, rows: int, output: str, streaming: bool):
+    module = load_generator(path)
+    data = generate_page_analysis(rows)
+    return lambda: module.ExcelReportGenerator(data).create_report(output)
+
+
+def _run_website(path: str, rows: int, output: str, streaming: bool):
+    module = load_generator(path)
+    data = generate_site_analysis(rows)
+    return lambda: module.create_security_report(data, output)
+
+
+# 측정 대상: 이름 -> (기본 모듈 경로, 준비 함수)
+# 준비 함수는 모듈 로드와 입력 생성을 마치고 측정할 호출만 반환
+TARGETS = {
+    'detailed': (os.path.join(SCRIPT_DIR, 'excel_generator.py'), _run_detailed),
+    'original': (os.path.join(SCRIPT_DIR, 'excel_generator_original.py'), _run_original),
+    'website': (os.path.join(SCRIPT_DIR, 'website_security_analysis.py'), _run_website),
+}
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB)"""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 는 bytes, Linux 는 KB 단위
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _run_case(target: str, path: str, rows: int, streaming: bool, queue):
+    """별도 프로세스에서 보고서 1회 생성 후 측정값 전달"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, "benchmark.xlsx")
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                run = TARGETS[target][1](path, rows, output, streaming)
+                baseline_rss = peak_rss_mb()
+                start = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - start
+            file_size = os.path.getsize(output)
+    except Exception as e:
+        queue.put({'target': target, 'rows': rows, 'streaming': streaming, 'error': f"{type(e).__name__}: {e}"})
+        return
+
+    queue.put({
+        'target': target,
+        'rows': rows,
+        'streaming': streaming,
+        'seconds': round(elapsed, 2),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'report_rss_mb': round(peak_rss_mb() - baseline_rss, 1),
+        'file_size_bytes': file_size
+    })
+
+
+def run_case(target: str, rows: int, streaming: bool = False, path: Optional[str] = None) -> Dict[str, Any]:
+    """측정 1건 실행 (프로세스마다 최대 RSS 가 독립적으로 집계되도록 분리)"""
+    path = path or TARGETS[target][0]
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_run_case, args=(target, path, rows, streaming, queue))
+    process.start()
+    process.join()
+    if queue.empty():
+        # 메모리 부족 등으로 프로세스가 강제 종료된 경우
+        return {'target': target, 'rows': rows, 'streaming': streaming,
+                'error': f"process exited with code {process.exitcode}"}
+    result = queue.get()
+    result['module'] = os.path.relpath(path, SCRIPT_DIR)
+    return result
+
+
+def git_revision() -> Optional[str]:
+    """측정한 코드의 git 리비전 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(results: List[Dict[str, Any]], baseline_path: str):
+    """기준 결과 파일과 시간/메모리/파일 크기 비율 출력"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r['target'], r['rows'], r['streaming']): r for r in baseline['results'] if 'error' not in r}
+
+    print(f"\nbaseline: {baseline_path} (revision {baseline['meta'].get('revision')})")
+    print(f"{'target':>10} {'rows':>10} {'time x':>10} {'peak x':>10} {'size x':>10}")
+    for result in results:
+        old = previous.get((result['target'], result['rows'], result['streaming']))
+        if old is None or 'error' in result:
+            continue
+        ratios = [result[key] / old[key] if old[key] else 0.0
+                  for key in ('seconds', 'peak_rss_mb', 'file_size_bytes')]
+        print(f"{result['target']:>10} {result['rows']:>10} " + " ".join(f"{ratio:>10.2f}" for ratio in ratios))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보고서 생성 성능 측정")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS,
+                        help="측정할 분석 행 수 목록")
+    parser.add_argument('--targets', nargs='+', choices=list(TARGETS), default=list(TARGETS),
+                        help="측정할 보고서 생성기")
+    parser.add_argument('--generator', default=None,
+                        help="detailed 대상으로 측정할 excel_generator.py 경로 (이전 버전 비교용)")
+    parser.add_argument('--streaming', action='store_true', help="detailed 대상을 write-only 스트리밍 모드로 측정")
+    parser.add_argument('--json', dest='json_path', help="측정 결과를 저장할 JSON 파일 경로")
+    parser.add_argument('--compare', help="비교할 이전 측정 결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'target':>10} {'rows':>10} {'mode':>10} {'seconds':>10} {'peak MB':>10} {'report MB':>10} {'file MB':>10}")
+    for target in args.targets:
+        path = args.generator if target == 'detailed' else None
+        streaming = args.streaming and target == 'detailed'
+        for rows in args.rows:
+            result = run_case(target, rows, streaming, path)
+            results.append(result)
+            mode = 'streaming' if streaming else 'normal'
+            if 'error' in result:
+                print(f"{target:>10} {rows:>10} {mode:>10}  failed: {result['error']}")
+                continue
+            print(f"{target:>10} {rows:>10} {mode:>10} {result['seconds']:>10} {result['peak_rss_mb']:>10} "
+                  f"{result['report_rss_mb']:>10} {result['file_size_bytes'] / (1024 * 1024):>10.1f}")
+
+    if args.json_path:
+        report = {
+            'meta': {
+                'revision': git_revision(),
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform()
+            },
+            'results': results
+        }
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
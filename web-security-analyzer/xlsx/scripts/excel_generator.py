@@ -3,11 +3,16 @@
 """
 엑셀 보고서 생성 스크립트
 웹 보안 분석 결과를 엑셀 파일로 생성
+
+분석 행 목록(메뉴별 상세 분석)과 페이지 분석 결과(excel_generator_original 형식)를 하나의
+보고서 엔진으로 처리. 시트는 register_sheet 로 등록한 빌더이며 필요한 시트만 선택하여 생성
+상세 행이 많으면 상세 시트를 여러 시트(또는 별도 파일)로 나누고 목차 시트를 추가
 """
 
 # Windows 콘솔 인코딩 설정
 import sys
 import os
+import unicodedata
 if sys.platform == 'win32':
     try:
         # 콘솔 UTF-8 모드 설정 (Windows 10+)
@@ -18,26 +23,243 @@ if sys.platform == 'win32':
         # 대안: 환경변수 설정
         os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-import pandas as pd
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.chart import BarChart, Reference
-import json
 from datetime import datetime, timedelta
-import os
-from typing import Dict, List, Any
+from itertools import islice
+from typing import Dict, List, Any, Iterable, Optional
+from urllib.parse import urlsplit
+
+from findings_table import (FINDING_COLUMNS, build_findings_frame, summarize_findings, summarize_finding_rows,
+                            iter_finding_rows)
+from findings_export import TEXT_FORMATS, EXPORT_FORMATS, parquet_available, write_text_exports, write_parquet
+from findings_log import iter_log_rows
+
+# openpyxl 과 pandas 는 import 비용이 커서(수백 ms) 필요한 형식을 만들 때만 import
+# (csv/jsonl 만 만들면 둘 다 읽지 않고, 분석 행이 적으면 pandas 없이 행 단위로 집계)
+COLUMNAR_MIN_ROWS = 5000
+
+# 공용 셀 스타일 정의
+# 셀마다 Font/Border/PatternFill 을 새로 만들지 않고 워크북에 NamedStyle 로 한 번 등록한 뒤
+# 이름으로만 참조함 (openpyxl 저장 시 스타일 중복 제거 비용도 사라짐)
+# 스타일 객체는 워크북을 만들 때 생성하므로 여기에는 인자만 정의 (font: Font 인자, fill: 배경색,
+# alignment: Alignment 인자, border: 테두리 선 종류)
+FONT_NAME = "맑은 고딕"
+BODY_FONT = {'name': FONT_NAME}
+CENTER_ALIGNMENT = {'horizontal': "center"}
+WRAP_ALIGNMENT = {'horizontal': "left", 'vertical': "top", 'wrap_text': True}
+
+STYLE_SPECS = {
+    'report_title': {'font': {'bold': True, 'size': 16, 'color': "366092", 'name': FONT_NAME}},
+    'report_subtitle': {'font': {'bold': True, 'size': 12, 'name': FONT_NAME}},
+    'report_header': {
+        'font': {'bold': True, 'color': "FFFFFF", 'name': FONT_NAME},
+        'fill': "366092",
+        'alignment': {'horizontal': "center", 'vertical': "center"},
+        'border': "thin"
+    },
+    'table_header': {
+        'font': {'bold': True, 'name': FONT_NAME},
+        'fill': "F2F2F2",
+        'border': "thin"
+    },
+    'body': {'font': BODY_FONT, 'border': "thin"},
+    'body_center': {'font': BODY_FONT, 'border': "thin", 'alignment': CENTER_ALIGNMENT},
+    'body_wrap': {'font': BODY_FONT, 'border': "thin", 'alignment': WRAP_ALIGNMENT},
+    'severity_high': {'font': BODY_FONT, 'border': "thin", 'alignment': CENTER_ALIGNMENT, 'fill': "FFE6E6"},
+    'severity_medium': {'font': BODY_FONT, 'border': "thin", 'alignment': CENTER_ALIGNMENT, 'fill': "FFF4E6"},
+    'severity_low': {'font': BODY_FONT, 'border': "thin", 'alignment': CENTER_ALIGNMENT, 'fill': "E6F3FF"},
+    'status_good': {'font': BODY_FONT, 'border': "thin", 'fill': "E6FFE6"},
+    'status_bad': {'font': BODY_FONT, 'border': "thin", 'fill': "FFE6E6"},
+    'section_high': {'font': {'bold': True, 'size': 12, 'name': FONT_NAME}, 'fill': "FFCCCC"},
+    'section_medium': {'font': {'bold': True, 'size': 12, 'name': FONT_NAME}, 'fill': "FFFACD"},
+    'section_low': {'font': {'bold': True, 'size': 12, 'name': FONT_NAME}, 'fill': "E6FFE6"},
+}
+
+SEVERITY_STYLES = {"HIGH": 'severity_high', "MEDIUM": 'severity_medium', "LOW": 'severity_low'}
+
+# 열 너비 추정
+# 행을 기록하면서 값의 표시 폭(한글 등 전각 문자는 2칸)을 열별 최댓값으로 누적하고 시트를 마칠 때 적용
+# 시트마다 처음 WIDTH_SAMPLE_ROWS 행만 측정하므로 행 수와 무관하게 측정 비용이 일정하며,
+# write-only 시트는 열 너비를 첫 행 기록 전에 지정해야 하므로 측정할 행까지만 모아 두었다가 너비 지정 후 기록
+WIDTH_SAMPLE_ROWS = 1000
+COLUMN_WIDTH_PADDING = 2
+COLUMN_MAX_WIDTH = 50
+
+
+def display_width(value) -> int:
+    """셀 값의 표시 폭 (동아시아 전각/넓은 문자는 2칸, 여러 줄이면 가장 긴 줄)"""
+    if value is None:
+        return 0
+    text = value if isinstance(value, str) else str(value)
+    if text.isascii():
+        return max(map(len, text.split("\n"))) if "\n" in text else len(text)
+    return max(sum(2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in line)
+               for line in text.split("\n"))
+
+
+def register_named_styles(workbook):
+    """워크북에 공용 NamedStyle 등록 (NamedStyle 은 워크북마다 새로 만들어야 함)
+
+    셀 서식(xf) 번호도 등록 순서로 미리 고정하므로 어떤 시트를 기록하든 styles.xml 이 같음
+    (시트를 따로 저장한 파트를 합치는 병렬 렌더링의 전제, xlsx_parts 참고)
+    xf 번호는 임시 시트의 셀에 스타일을 지정하고 style_id 를 읽을 때 등록 순서대로 부여됨
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+
+    for name, spec in STYLE_SPECS.items():
+        style = NamedStyle(name=name, font=Font(**spec['font']))
+        if 'fill' in spec:
+            style.fill = PatternFill(start_color=spec['fill'], end_color=spec['fill'], fill_type="solid")
+        if 'alignment' in spec:
+            style.alignment = Alignment(**spec['alignment'])
+        if 'border' in spec:
+            side = Side(style=spec['border'])
+            style.border = Border(left=side, right=side, top=side, bottom=side)
+        workbook.add_named_style(style)
+
+    scratch = workbook.create_sheet()
+    for name in STYLE_SPECS:
+        cell = WriteOnlyCell(scratch)
+        cell.style = name
+        cell.style_id
+    workbook.remove(scratch)
+
+
+# 시트 구성 요소
+# 시트 빌더는 (generator, worksheet) 를 받아 시트 하나를 기록하는 함수로, register_sheet 로 등록
+# 모든 빌더는 generator 의 공용 기록 경로(_write_row/_add_table, NamedStyle, 스트리밍 겸용)를 사용하며
+# 보고서는 선택한 시트의 빌더만 실행 (외부 모듈에서 같은 방법으로 시트를 추가 등록 가능)
+# 행이 많은 시트는 expand 로 여러 시트(시트 계획 항목 (key, title, part))로 나눌 수 있으며,
+# 나뉜 시트의 빌더는 (generator, worksheet, part) 로 호출됨
+SHEET_REGISTRY: Dict[str, Dict[str, Any]] = {}
+
+
+def register_sheet(key: str, title: str, expand=None):
+    """시트 빌더 등록 데코레이터 (key: 시트 선택용 키, title: 시트 이름)
+
+    expand(generator, output_filename) 는 시트를 나눌 때 시트 계획 항목 목록, 나누지 않으면 None 반환
+    """
+    def decorator(build):
+        SHEET_REGISTRY[key] = {'title': title, 'build': build, 'expand': expand}
+        return build
+    return decorator
+
+
+# 상세 시트 분할
+# Excel 시트 최대 행 수는 1,048,576 이며 그보다 훨씬 적은 행에서도 파일을 여는 시간이 크게 늘어나므로
+# 상세 행이 DETAIL_SHEET_MAX_ROWS 를 넘으면 여러 시트로 나누고 목차 시트(링크)를 추가
+# (configure_detail_split 으로 시트당 행 수, 메뉴/호스트 단위 분할, 시트별 별도 파일 생성 선택)
+EXCEL_MAX_ROWS = 1048576
+DETAIL_HEADER_ROWS = 3  # 제목, 빈 행, 헤더
+DETAIL_SHEET_MAX_ROWS = 100000
+DETAIL_SPLIT_KEYS = {"menu": "메뉴", "host": "호스트"}
+SHEET_TITLE_MAX_LENGTH = 31
+SHEET_TITLE_INVALID = str.maketrans({char: "_" for char in "[]:*?/\\"})
+
+
+# 기본 시트 구성 (분석 행 목록 / 페이지 분석 결과)
+DETAILED_SHEETS = ("menu_details", "summary", "vulnerability_summary")
+PAGE_SHEETS = ("summary", "basic_info", "security", "forms", "navigation", "storage", "network",
+               "vulnerabilities", "recommendations")
+
 
 class ExcelReportGenerator:
-    """웹 보안 분석 결과 엑셀 보고서 생성기"""
+    """웹 보안 분석 결과 엑셀 보고서 생성기 (통합 보고서 엔진)
+
+    analysis_results 는 분석 행 목록(메뉴별 상세 분석 형식) 또는 페이지 분석 결과 dict
+    (basic_info/security/forms/... , excel_generator_original 형식). 두 형식 모두 같은 분석 행 모델
+    (findings, statistics)로 정규화되며, 시트는 SHEET_REGISTRY 에 등록된 빌더로 생성
+    """
 
     def __init__(self, analysis_results: Dict[str, Any]):
         self.analysis_results = analysis_results
         self.workbook = None
         self.current_row = 1
+        self.streaming = False
+        self._written_rows = 0
+        self._findings = None
+        self._findings_frame = None
+        self._statistics = None
+        self._page_recommendations = None
+        self.findings_log = None
+        self._write_only_cell = None
+        self._hyperlink = None
+        self._column_widths = {}
+        self._measured_rows = 0
+        self._pending_rows = None
+        self.width_sample_rows = WIDTH_SAMPLE_ROWS
+        self.detail_max_rows = DETAIL_SHEET_MAX_ROWS
+        self.detail_split_by = None
+        self.detail_workbooks = False
+        self.linked_workbooks = []
+
+    @classmethod
+    def from_findings_log(cls, path: str) -> "ExcelReportGenerator":
+        """분석 행 로그(findings_log.FindingsLog) 기반 생성기
+
+        행 목록을 메모리에 올리지 않고 로그를 두 번 순회 (집계 1회, 상세 행 기록 1회)
+        streaming=True 와 함께 사용하면 사이트 규모와 무관하게 메모리 사용량이 일정
+        """
+        generator = cls([])
+        generator.findings_log = path
+        return generator
+
+    def configure_detail_split(self, max_rows: int = DETAIL_SHEET_MAX_ROWS, by: str = None,
+                               workbooks: bool = False) -> "ExcelReportGenerator":
+        """상세 시트(menu_details) 분할 설정
+
+        max_rows: 시트당 최대 상세 행 수 (넘으면 다음 시트로, Excel 시트 행 한도 이내)
+        by: "menu"/"host" 이면 메뉴 또는 URL 호스트마다 시트를 나눔 (한 값이 max_rows 를 넘으면 다시 나눔)
+        workbooks: True 이면 나뉜 상세 시트를 각각 별도 파일로 저장하고 보고서에는 목차(파일 링크)만 포함
+        """
+        if not 0 < max_rows <= EXCEL_MAX_ROWS - DETAIL_HEADER_ROWS:
+            raise ValueError(f"시트당 행 수는 1 ~ {EXCEL_MAX_ROWS - DETAIL_HEADER_ROWS} 사이여야 함: {max_rows}")
+        if by is not None and by not in DETAIL_SPLIT_KEYS:
+            raise ValueError(f"지원하지 않는 분할 기준: {by} ({', '.join(DETAIL_SPLIT_KEYS)})")
+        self.detail_max_rows = max_rows
+        self.detail_split_by = by
+        self.detail_workbooks = workbooks
+        return self
+
+    def create_report(self, output_filename: str = None, sheets: Iterable[str] = None,
+                      streaming: bool = False, processes: int = None) -> str:
+        """선택한 시트로 보고서 생성
+
+        sheets 는 SHEET_REGISTRY 의 시트 키 목록 (순서대로 생성), 생략하면 입력 형식에 맞는 기본 구성
+        (페이지 분석 결과는 PAGE_SHEETS, 분석 행 목록은 DETAILED_SHEETS). 선택하지 않은 시트의
+        데이터(집계, 권장 사항 등)는 계산하지 않음
+        processes 가 2 이상이면 시트를 작업 프로세스에 나누어 생성한 뒤 하나의 파일로 조립
+        """
+        if sheets is None:
+            sheets = PAGE_SHEETS if self.page else DETAILED_SHEETS
+        output_filename = self._render(output_filename, sheets, streaming, processes)
+        print(f"Excel report created: {output_filename}")
+        if self.linked_workbooks:
+            print(f"Linked detail workbooks created: {len(self.linked_workbooks)} "
+                  f"({self.linked_workbooks[0]} ~ {self.linked_workbooks[-1]})")
+        return output_filename
 
-    def create_detailed_report(self, output_filename: str = None) -> str:
-        """메뉴별 상세 보고서 생성 함수"""
+    def create_detailed_report(self, output_filename: str = None, streaming: bool = False,
+                               processes: int = None) -> str:
+        """메뉴별 상세 보고서 생성 함수
+
+        streaming=True 이면 openpyxl write-only 워크북으로 행을 생성 즉시 기록하여
+        분석 행 수가 많아도 메모리 사용량이 일정하게 유지됨
+        """
+        output_filename = self._render(output_filename, DETAILED_SHEETS, streaming, processes)
+        print(f"Detailed Excel report created: {output_filename}")
+        if self.linked_workbooks:
+            print(f"Linked detail workbooks created: {len(self.linked_workbooks)} "
+                  f"({self.linked_workbooks[0]} ~ {self.linked_workbooks[-1]})")
+        return output_filename
+
+    def _render(self, output_filename: str, sheets: Iterable[str], streaming: bool,
+                processes: int = None) -> str:
+        """선택한 시트 빌더를 순서대로 실행하여 워크북 저장"""
+        sheets = list(sheets)
+        unknown = [key for key in sheets if key not in SHEET_REGISTRY]
+        if unknown:
+            raise ValueError(f"등록되지 않은 시트: {', '.join(unknown)}")
 
         if output_filename is None:
             # 현재 한국 시간으로 날짜 생성
@@ -45,248 +267,135 @@ class ExcelReportGenerator:
             timestamp = kst.strftime("%Y%m%d_%H%M%S")
             output_filename = f"web_security_analysis_{timestamp}.xlsx"
 
-        # 워크북 생성
-        self.workbook = openpyxl.Workbook()
+        # 시트 계획 (행이 많은 시트는 여러 시트로 나뉘고, 별도 파일로 보낸 시트는 linked 로 분리)
+        plan = []
+        for key in sheets:
+            spec = SHEET_REGISTRY[key]
+            expanded = spec['expand'](self, output_filename) if spec['expand'] else None
+            plan.extend(expanded if expanded is not None else [(key, spec['title'], None)])
+        linked = [(part['workbook_path'], [(key, title, part)])
+                  for key, title, part in plan if part and 'workbook_path' in part]
+        plan = [item for item in plan if not (item[2] and 'workbook_path' in item[2])]
+        self.linked_workbooks = [path for path, _ in linked]
+
+        if processes is not None and processes > 1 and len(plan) + len(linked) > 1:
+            return self._render_parallel(output_filename, plan, linked, streaming, processes)
+
+        for path, items in linked:
+            self._render_plan(path, items, streaming)
+        return self._render_plan(output_filename, plan, streaming)
+
+    def _render_plan(self, output_filename: str, plan: List[tuple], streaming: bool) -> str:
+        """시트 계획 항목 (key, title, part) 을 순서대로 기록하여 워크북 하나 저장"""
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.worksheet.hyperlink import Hyperlink
 
-        # 기본 시트 삭제
-        self.workbook.remove(self.workbook.active)
-
-        # 메뉴별 상세 분석 시트 생성
-        self._create_menu_based_analysis_sheet()
-
-        # 요약 시트 생성
-        self._create_summary_sheet()
-        self._create_vulnerability_summary_sheet()
+        # 워크북 생성
+        self.streaming = streaming
+        self.workbook = openpyxl.Workbook(write_only=streaming)
+        self._write_only_cell = WriteOnlyCell
+        self._hyperlink = Hyperlink
+
+        # 기본 시트 삭제 (write-only 워크북은 기본 시트가 없음)
+        if not streaming:
+            self.workbook.remove(self.workbook.active)
+        register_named_styles(self.workbook)
+
+        for key, title, part in plan:
+            build = SHEET_REGISTRY[key]['build']
+            ws = self._create_sheet(title)
+            if part is None:
+                build(self, ws)
+            else:
+                build(self, ws, part)
+            self._finish_sheet(ws)
 
         # 파일 저장
         self.workbook.save(output_filename)
-        print(f"Detailed Excel report created: {output_filename}")
-
         return output_filename
 
-    def _create_menu_based_analysis_sheet(self):
-        """메뉴별 상세 분석 시트 생성"""
-        ws = self.workbook.create_sheet("메뉴별 상세 분석")
-
-        # 제목
-        self._add_title(ws, "메뉴별 웹 보안 상세 분석")
-
-        # 헤더 행 정의
-        headers = [
-            "메뉴", "URL", "요소유형", "요소명", "파라미터",
-            "HTTP메소드", "취약점종류", "위험도", "상세설명",
-            "패턴", "인증필요", "권장조치"
-        ]
-
-        # 헤더 추가 (한글 폰트 지원)
-        for col_idx, header in enumerate(headers, 1):
-            # 한글 헤더 처리
-            try:
-                normalized_header = header.encode('utf-8').decode('utf-8')
-            except (UnicodeEncodeError, UnicodeDecodeError):
-                normalized_header = header
-
-            cell = ws.cell(row=self.current_row, column=col_idx, value=normalized_header)
-            cell.font = Font(bold=True, color="FFFFFF", name="맑은 고딕")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = Border(
-                left=Side(style="thin"), right=Side(style="thin"),
-                top=Side(style="thin"), bottom=Side(style="thin")
-            )
-
-        self.current_row += 1
-
-        # 데이터 처리
-        if isinstance(self.analysis_results, list):
-            # 새로운 형식: 리스트 형태의 분석 데이터
-            data_rows = self.analysis_results
-        else:
-            # 기존 형식을 새로운 형식으로 변환
-            data_rows = self._convert_legacy_format(self.analysis_results)
-
-        # 데이터 행 추가 (한글 인코딩 지원)
-        for row_data in data_rows:
-            for col_idx, header in enumerate(headers, 1):
-                value = row_data.get(header, "")
-                if value is None:
-                    value = ""
-
-                # 한글 값 처리
-                if isinstance(value, str):
-                    try:
-                        normalized_value = value.encode('utf-8').decode('utf-8')
-                    except (UnicodeEncodeError, UnicodeDecodeError):
-                        normalized_value = value
-                else:
-                    normalized_value = value
-
-                cell = ws.cell(row=self.current_row, column=col_idx, value=normalized_value)
-
-                # 한글 폰트 설정
-                cell.font = Font(name="맑은 고딕")
-
-                # 위험도에 따른 색상 지정
-                if header == "위험도":
-                    if str(normalized_value).upper() == "HIGH":
-                        cell.fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
-                    elif str(normalized_value).upper() == "MEDIUM":
-                        cell.fill = PatternFill(start_color="FFF4E6", end_color="FFF4E6", fill_type="solid")
-                    elif str(normalized_value).upper() == "LOW":
-                        cell.fill = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
-
-                # 테두리 추가
-                cell.border = Border(
-                    left=Side(style="thin"), right=Side(style="thin"),
-                    top=Side(style="thin"), bottom=Side(style="thin")
-                )
-
-                # 정렬
-                if header in ["메뉴", "요소유형", "취약점종류", "위험도", "인증필요"]:
-                    cell.alignment = Alignment(horizontal="center")
-                elif header in ["상세설명", "권장조치"]:
-                    cell.alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
-
-            self.current_row += 1
-
-        # 열 너비 자동 조정
-        column_widths = [15, 40, 10, 30, 25, 12, 15, 10, 50, 25, 10, 30]
-        for col_idx, width in enumerate(column_widths, 1):
-            ws.column_dimensions[openpyxl.utils.get_column_letter(col_idx)].width = width
-
-        # 필터 추가
-        ws.auto_filter.ref = f"A1:{openpyxl.utils.get_column_letter(len(headers))}{self.current_row - 1}"
-
-        # 셀 고정 (헤더 행)
-        ws.freeze_panes = "A2"
-
-    def _create_vulnerability_summary_sheet(self):
-        """취약점 요약 시트 생성"""
-        ws = self.workbook.create_sheet("취약점 요약")
-
-        # 제목
-        self._add_title(ws, "취약점 종류별 요약")
-
-        # 데이터 처리
-        if isinstance(self.analysis_results, list):
-            data_rows = self.analysis_results
-        else:
-            data_rows = self._convert_legacy_format(self.analysis_results)
-
-        # 취약점 종류별 통계
-        vuln_stats = {}
-        severity_stats = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-        type_stats = {}
-
-        for row in data_rows:
-            vuln_type = row.get("취약점종류", "")
-            severity = str(row.get("위험도", "")).upper()
-
-            if vuln_type:
-                type_stats[vuln_type] = type_stats.get(vuln_type, 0) + 1
-
-            if severity in severity_stats:
-                severity_stats[severity] += 1
-
-        # 위험도별 통계 테이블
-        self._add_subtitle(ws, "위험도별 분포")
-
-        severity_data = [
-            ["위험도", "개수", "비율(%)"],
-            ["HIGH", severity_stats["HIGH"], ""],
-            ["MEDIUM", severity_stats["MEDIUM"], ""],
-            ["LOW", severity_stats["LOW"], ""],
-            ["총계", sum(severity_stats.values()), "100.0"]
-        ]
-
-        # 비율 계산
-        total = sum(severity_stats.values())
-        if total > 0:
-            severity_data[1][2] = f"{severity_stats['HIGH']/total*100:.1f}"
-            severity_data[2][2] = f"{severity_stats['MEDIUM']/total*100:.1f}"
-            severity_data[3][2] = f"{severity_stats['LOW']/total*100:.1f}"
-
-        self._add_table(ws, severity_data)
-
-        # 취약점 종류별 통계
-        if type_stats:
-            self.current_row += len(severity_data) + 2
-            self._add_subtitle(ws, "취약점 종류별 분포")
-
-            type_data = [["취약점 종류", "개수"]]
-            for vuln_type, count in sorted(type_stats.items(), key=lambda x: x[1], reverse=True):
-                type_data.append([vuln_type, count])
-
-            self._add_table(ws, type_data)
-
-        # 권장 조치 요약
-        self.current_row += len(type_data) + 2
-        self._add_subtitle(ws, "주요 권장 조치")
-
-        recommendations = {}
-        for row in data_rows:
-            action = row.get("권장조치", "")
-            if action:
-                recommendations[action] = recommendations.get(action, 0) + 1
-
-        if recommendations:
-            rec_data = [["권장 조치", "발생 빈도"]]
-            for action, count in sorted(recommendations.items(), key=lambda x: x[1], reverse=True)[:10]:
-                rec_data.append([action, count])
-
-            self._add_table(ws, rec_data)
-
-    def _create_summary_sheet(self):
-        """요약 정보 시트 생성"""
-        ws = self.workbook.create_sheet("요약 정보")
+    def _render_config(self) -> Dict[str, Any]:
+        """작업 프로세스 생성기에 그대로 옮길 렌더링 설정 (RENDER_CONFIG_ATTRIBUTES)"""
+        return {name: getattr(self, name) for name in RENDER_CONFIG_ATTRIBUTES}
+
+    def _render_parallel(self, output_filename: str, plan: List[tuple], linked: List[tuple], streaming: bool,
+                         processes: int) -> str:
+        """시트별 파트 파일을 작업 프로세스에서 생성한 뒤 하나의 xlsx 로 조립
+
+        작업 프로세스는 같은 입력(analysis_results 또는 분석 행 로그 경로)으로 생성기를 하나씩 만들어
+        시트를 파트 파일로 저장하고, 조립은 시트 XML 을 다시 해석하지 않고 zip 파트만 옮김 (xlsx_parts)
+        별도 파일로 나눈 상세 시트(linked)는 작업 프로세스가 최종 파일로 바로 저장
+        생성 시간은 (가장 큰 시트의 기록 시간 + 조립 시간)에 가까워짐 (코어 수가 시트 수 이상일 때)
+        """
+        import tempfile
+        from concurrent.futures import ProcessPoolExecutor
+        from xlsx_parts import assemble_workbook
+
+        with tempfile.TemporaryDirectory(prefix="xlsx_parts_") as part_dir:
+            part_paths = [os.path.join(part_dir, f"part{idx}.xlsx") for idx in range(len(plan))]
+            tasks = [(path, [item]) for path, item in zip(part_paths, plan)] + linked
+            with ProcessPoolExecutor(max_workers=min(processes, len(tasks)), initializer=_init_part_worker,
+                                     initargs=(self.analysis_results, self.findings_log,
+                                               self._render_config())) as executor:
+                list(executor.map(_render_sheet_part, *zip(*tasks), [streaming] * len(tasks)))
+            if part_paths:
+                assemble_workbook(part_paths, output_filename)
+        return output_filename
 
-        # 제목
-        self._add_title(ws, "웹 보안 분석 보고서 요약")
+    def create_reports(self, formats=("xlsx",), output_basename: str = None,
+                       streaming: bool = False, sheets: Iterable[str] = None,
+                       processes: int = None) -> Dict[str, str]:
+        """선택한 형식(xlsx/csv/jsonl/parquet)으로 보고서 생성
 
-        # 기본 정보
-        if isinstance(self.analysis_results, list):
-            # 새로운 형식의 데이터 처리
-            # 현재 한국 시간으로 날짜 생성
-            kst = datetime.now() + timedelta(hours=9)
-            summary_data = [
-                ["분석 대상", "웹사이트 전체"],
-                ["분석 시간", kst.strftime("%Y-%m-%d %H:%M:%S")],
-                ["총 분석 항목", len(self.analysis_results)],
-                ["분석 방식", "Chrome DevTools + 패턴 분석"],
-            ]
-
-            # 위험도별 통계
-            severity_stats = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-            for row in self.analysis_results:
-                severity = str(row.get("위험도", "")).upper()
-                if severity in severity_stats:
-                    severity_stats[severity] += 1
-
-            summary_data.extend([
-                ["HIGH 위험도 취약점", severity_stats["HIGH"]],
-                ["MEDIUM 위험도 취약점", severity_stats["MEDIUM"]],
-                ["LOW 위험도 취약점", severity_stats["LOW"]],
-                ["총 취약점", sum(severity_stats.values())]
-            ])
-        else:
-            # 기존 형식의 데이터 처리
-            basic_info = self.analysis_results.get('basic_info', {})
-            security_info = self.analysis_results.get('security', {})
+        csv/jsonl 은 분석 행을 한 번 순회하며 동시에 기록하고, xlsx 를 선택하지 않으면
+        엑셀 생성 비용 없이 기계 판독용 파일만 생성. 형식 -> 생성된 파일 경로 반환
+        xlsx 시트는 sheets 로 선택 (생략 시 메뉴별 상세 보고서 구성), processes 는 create_report 참고
+        """
+        unknown = set(formats) - set(EXPORT_FORMATS) - {"xlsx"}
+        if unknown:
+            raise ValueError(f"지원하지 않는 형식: {', '.join(sorted(unknown))}")
 
-            # 현재 한국 시간으로 날짜 생성
+        if output_basename is None:
             kst = datetime.now() + timedelta(hours=9)
-
-            summary_data = [
-                ["분석 대상 URL", basic_info.get('url', 'N/A')],
-                ["사이트 제목", basic_info.get('title', 'N/A')],
-                ["분석 시간", kst.strftime("%Y-%m-%d %H:%M:%S")],
-                ["프로토콜", basic_info.get('protocol', 'N/A')],
-                ["HTTPS 사용", "예" if security_info.get('isHTTPS') else "아니오"],
-                ["총 폼 수", len(self.analysis_results.get('forms', []))],
-                ["내부 링크 수", self.analysis_results.get('navigation', {}).get('internalLinks', 0)],
-            ]
-
-        self._add_table(ws, summary_data, start_col=1, start_row=self.current_row)
+            output_basename = f"web_security_analysis_{kst.strftime('%Y%m%d_%H%M%S')}"
+
+        outputs = {}
+        text_paths = {fmt: f"{output_basename}.{fmt}" for fmt in TEXT_FORMATS if fmt in formats}
+        if text_paths:
+            count = write_text_exports(self.iter_findings(), text_paths)
+            for fmt, path in text_paths.items():
+                print(f"{fmt.upper()} report created: {path} ({count} rows)")
+            outputs.update(text_paths)
+
+        if "parquet" in formats:
+            if parquet_available():
+                outputs["parquet"] = write_parquet(self.findings_frame, f"{output_basename}.parquet")
+                print(f"Parquet report created: {outputs['parquet']}")
+            else:
+                print("⚠️ pyarrow 미설치 - Parquet 보고서 생략 (pip install pyarrow)")
+
+        if "xlsx" in formats:
+            if sheets is None:
+                outputs["xlsx"] = self.create_detailed_report(f"{output_basename}.xlsx", streaming=streaming,
+                                                              processes=processes)
+            else:
+                outputs["xlsx"] = self.create_report(f"{output_basename}.xlsx", sheets, streaming=streaming,
+                                                     processes=processes)
+
+        return outputs
+
+    @property
+    def page(self) -> Dict[str, Any]:
+        """페이지 분석 결과 (분석 행 목록으로 만든 생성기는 빈 dict)"""
+        return self.analysis_results if isinstance(self.analysis_results, dict) else {}
+
+    @property
+    def page_recommendations(self) -> List[Dict[str, str]]:
+        """페이지 분석 결과 기반 권장 사항 (최초 접근 시 한 번만 생성)"""
+        if self._page_recommendations is None:
+            self._page_recommendations = generate_page_recommendations(self.page)
+        return self._page_recommendations
 
     def _convert_legacy_format(self, legacy_data):
         """기존 형식의 데이터를 새로운 형식으로 변환"""
@@ -369,64 +478,889 @@ class ExcelReportGenerator:
         }
         return recommendations.get(vuln_type, '상세한 보안 검토 필요')
 
-    # 보조 메소드들
+    @property
+    def findings(self) -> List[Dict[str, Any]]:
+        """정규화된 분석 행 목록 (기존 형식은 최초 접근 시 한 번만 변환)"""
+        if self._findings is None:
+            if isinstance(self.analysis_results, list):
+                # 새로운 형식: 리스트 형태의 분석 데이터
+                self._findings = self.analysis_results
+            else:
+                # 기존 형식을 새로운 형식으로 변환
+                self._findings = self._convert_legacy_format(self.analysis_results)
+        return self._findings
+
+    def iter_findings(self) -> Iterable[Dict[str, Any]]:
+        """분석 행 순회 (로그 기반이면 호출할 때마다 로그를 처음부터 다시 읽음)"""
+        if self.findings_log is not None:
+            return iter_log_rows(self.findings_log)
+        return iter(self.findings)
+
+    def _columnar(self) -> bool:
+        """컬럼형(pandas) 처리 여부 (로그 기반이거나 행 수가 COLUMNAR_MIN_ROWS 미만이면 행 단위 처리)"""
+        if self.findings_log is not None:
+            return False
+        return self._findings_frame is not None or len(self.findings) >= COLUMNAR_MIN_ROWS
+
+    def _iter_detail_rows(self) -> Iterable[tuple]:
+        """FINDING_COLUMNS 순서의 상세 행 순회"""
+        if not self._columnar():
+            return (tuple("" if row.get(name) is None else row.get(name) for name in FINDING_COLUMNS)
+                    for row in self.iter_findings())
+        return iter_finding_rows(self.findings_frame)
+
+    @property
+    def findings_frame(self):
+        """컬럼형 분석 결과 (category dtype, 최초 접근 시 한 번만 생성)"""
+        if self._findings_frame is None:
+            self._findings_frame = build_findings_frame(self.iter_findings())
+        return self._findings_frame
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """위험도/취약점 종류/권장 조치 집계 (컬럼 단위 벡터화 집계, 로그 기반이거나 행이 적으면 한 번 순회하며 집계)"""
+        if self._statistics is None:
+            if not self._columnar():
+                self._statistics = summarize_finding_rows(self.iter_findings())
+            else:
+                self._statistics = summarize_findings(self.findings_frame)
+        return self._statistics
+
+
+    # 보조 메소드들 (시트 빌더 공용 기록 경로)
+    def _create_sheet(self, title):
+        """시트 생성 (시트마다 1행부터 기록, 열 너비 측정 초기화)"""
+        ws = self.workbook.create_sheet(title)
+        self.current_row = 1
+        self._written_rows = 0
+        self._column_widths = {}
+        self._measured_rows = 0
+        self._pending_rows = [] if self.streaming else None
+        return ws
+
+    def _finish_sheet(self, ws):
+        """시트 마무리 (측정한 열 너비 적용, 스트리밍이면 모아 둔 행 기록)"""
+        if self._pending_rows is not None:
+            self._flush_pending_rows(ws)
+        else:
+            self._apply_column_widths(ws)
+
+    def _apply_column_widths(self, ws):
+        """측정한 열 너비 지정 (표시 폭 + 여백, 최대 COLUMN_MAX_WIDTH)"""
+        from openpyxl.utils import get_column_letter
+
+        for col_idx, width in self._column_widths.items():
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(width + COLUMN_WIDTH_PADDING,
+                                                                         COLUMN_MAX_WIDTH)
+
+    def _flush_pending_rows(self, ws):
+        """열 너비를 지정한 뒤 모아 둔 행 기록 (이후 행은 바로 기록)"""
+        self._apply_column_widths(ws)
+        pending, self._pending_rows = self._pending_rows, None
+        for row in pending:
+            self._append_row(ws, *row)
+
+    def _measure_row(self, values, start_col):
+        """열별 최대 표시 폭 누적 (시트마다 width_sample_rows 행까지, None 이면 모든 행)"""
+        widths = self._column_widths
+        for col_idx, value in enumerate(values, start_col):
+            width = display_width(value)
+            if width > widths.get(col_idx, 0):
+                widths[col_idx] = width
+        self._measured_rows += 1
+
+    def _write_row(self, ws, row_idx, values, styles, start_col=1, links=None, measure=True):
+        """한 행 기록 (일반/스트리밍 워크북 공용)
+
+        styles 는 열별 NamedStyle 이름 목록 (STYLE_SPECS 참고, None 이면 기본 스타일)
+        links 는 열별 하이퍼링크 목록 ({'target': 파일/URL, 'location': 시트 위치} 또는 None)
+        measure=False 인 행(제목, 안내 문구)은 열 너비 측정에서 제외
+        """
+        sample = self.width_sample_rows
+        measuring = measure and (sample is None or self._measured_rows < sample)
+        if measuring:
+            self._measure_row(values, start_col)
+
+        if not self.streaming:
+            for col_idx, (value, style) in enumerate(zip(values, styles), start_col):
+                cell = ws.cell(row=row_idx, column=col_idx, value=value)
+                if style is not None:
+                    cell.style = style
+                if links and links[col_idx - start_col]:
+                    cell.hyperlink = self._hyperlink(ref="", **links[col_idx - start_col])
+            return
+
+        # 열 너비가 정해지기 전(측정 중)에는 행을 모아 둠
+        if self._pending_rows is not None:
+            self._pending_rows.append((row_idx, values, styles, start_col, links))
+            if measuring and sample is not None and self._measured_rows >= sample:
+                self._flush_pending_rows(ws)
+            return
+        self._append_row(ws, row_idx, values, styles, start_col, links)
+
+    def _append_row(self, ws, row_idx, values, styles, start_col=1, links=None):
+        """write-only 시트에 한 행 추가"""
+        # write-only 시트는 순차 append만 가능하므로 빈 행으로 위치를 맞춤
+        while self._written_rows < row_idx - 1:
+            ws.append([])
+            self._written_rows += 1
+
+        cells = [None] * (start_col - 1)
+        for offset, (value, style) in enumerate(zip(values, styles)):
+            cell = self._write_only_cell(ws, value=value)
+            if style is not None:
+                cell.style = style
+            if links and links[offset]:
+                cell.hyperlink = self._hyperlink(ref="", **links[offset])
+            cells.append(cell)
+        ws.append(cells)
+        self._written_rows = row_idx
+
+    @staticmethod
+    def _normalize_text(value):
+        """한글 값 처리 (문자열만 UTF-8 정규화)"""
+        if isinstance(value, str):
+            try:
+                return value.encode('utf-8').decode('utf-8')
+            except (UnicodeEncodeError, UnicodeDecodeError):
+                return value
+        return value
+
     def _add_title(self, ws, title):
         """제목 추가 (한글 폰트 지원)"""
-        # 한글 제목 처리
-        try:
-            normalized_title = title.encode('utf-8').decode('utf-8')
-        except (UnicodeEncodeError, UnicodeDecodeError):
-            normalized_title = title
-
-        cell = ws.cell(row=self.current_row, column=1, value=normalized_title)
-        cell.font = Font(bold=True, size=16, color="366092", name="맑은 고딕")
+        self._write_row(ws, self.current_row, [self._normalize_text(title)], ['report_title'], measure=False)
         self.current_row += 2
 
-    def _add_subtitle(self, ws, subtitle):
+    def _add_subtitle(self, ws, subtitle, style='report_subtitle'):
         """부제목 추가 (한글 폰트 지원)"""
-        # 한글 부제목 처리
-        try:
-            normalized_subtitle = subtitle.encode('utf-8').decode('utf-8')
-        except (UnicodeEncodeError, UnicodeDecodeError):
-            normalized_subtitle = subtitle
-
-        cell = ws.cell(row=self.current_row, column=1, value=normalized_subtitle)
-        cell.font = Font(bold=True, size=12, name="맑은 고딕")
+        self._write_row(ws, self.current_row, [self._normalize_text(subtitle)], [style], measure=False)
         self.current_row += 1
 
-    def _add_table(self, ws, data, start_col=1, start_row=None):
-        """테이블 추가 (한글 인코딩 지원)"""
+    def _add_note(self, ws, text):
+        """안내 문구 한 줄 추가 (데이터가 없는 시트 등)"""
+        self._write_row(ws, self.current_row, [self._normalize_text(text)], [None], measure=False)
+        self.current_row += 2
+
+    def _add_table(self, ws, data, start_col=1, start_row=None, highlight=None):
+        """테이블 추가 (한글 인코딩 지원)
+
+        highlight 는 {셀 값: NamedStyle 이름} 으로, 값이 일치하는 본문 셀에만 해당 스타일 적용
+        """
         if start_row is None:
             start_row = self.current_row
 
         for row_idx, row_data in enumerate(data, start_row):
-            for col_idx, value in enumerate(row_data, start_col):
-                # 한글 포함 값 처리
-                if isinstance(value, str):
-                    # Unicode 정규화로 한글 깨짐 방지
-                    try:
-                        normalized_value = value.encode('utf-8').decode('utf-8')
-                    except (UnicodeEncodeError, UnicodeDecodeError):
-                        normalized_value = value
-                else:
-                    normalized_value = value
-
-                cell = ws.cell(row=row_idx, column=col_idx, value=normalized_value)
-
-                if row_idx == start_row:  # 헤더 행
-                    cell.font = Font(bold=True, name="맑은 고딕")
-                    cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-                else:
-                    # 데이터 행은 한글 지원 폰트 설정
-                    cell.font = Font(name="맑은 고딕")
-
-                cell.border = Border(
-                    left=Side(style="thin"), right=Side(style="thin"),
-                    top=Side(style="thin"), bottom=Side(style="thin")
-                )
+            # 데이터 행은 한글 지원 폰트 설정
+            style = 'table_header' if row_idx == start_row else 'body'
+            # Unicode 정규화로 한글 깨짐 방지
+            values = [self._normalize_text(value) for value in row_data]
+            styles = [style] * len(values)
+            if highlight and row_idx != start_row:
+                styles = [highlight.get(value, style) if isinstance(value, str) else style for value in values]
+            self._write_row(ws, row_idx, values, styles, start_col=start_col)
 
         self.current_row = start_row + len(data) + 1
 
+
+# 작업 프로세스 생성기에 옮기는 설정 (시트 내용에 영향을 주는 속성을 추가하면 여기에도 추가)
+RENDER_CONFIG_ATTRIBUTES = ("detail_max_rows", "detail_split_by", "detail_workbooks", "width_sample_rows")
+
+# 병렬 렌더링 작업 프로세스 상태 (프로세스마다 생성기 하나를 두어 집계/권장 사항을 시트 간에 재사용)
+_part_report = None
+
+
+def _init_part_worker(analysis_results, findings_log, config: Dict[str, Any]):
+    """작업 프로세스 초기화 (입력과 렌더링 설정은 프로세스마다 한 번만 전달)"""
+    global _part_report
+    if findings_log is not None:
+        _part_report = ExcelReportGenerator.from_findings_log(findings_log)
+    else:
+        _part_report = ExcelReportGenerator(analysis_results)
+    for name, value in config.items():
+        setattr(_part_report, name, value)
+
+
+def _render_sheet_part(part_path: str, plan: List[tuple], streaming: bool) -> str:
+    """시트 계획 항목을 파트 파일로 저장 (작업 프로세스에서 실행)"""
+    return _part_report._render_plan(part_path, plan, streaming)
+
+
+# 페이지 분석 결과(excel_generator_original 형식) 취약점 설명
+VULNERABILITY_DESCRIPTIONS = {
+    'high': {
+        'HTTP 프로토콜 사용': '데이터가 암호화되지 않고 전송되어 중간자 공격에 취약합니다.',
+        '비밀번호 전송에 GET 방식 사용': '비밀번호가 URL에 노출되어 브라우저 기록이나 로그에 남을 수 있습니다.',
+        'Mixed Content': 'HTTPS 페이지에서 HTTP 리소스를 로드하여 보안이 취약해집니다.',
+        '민감정보 URL 노출': 'API 키나 비밀번호 같은 민감정보가 URL에 노출됩니다.'
+    },
+    'medium': {
+        '콘솔 오류': '시스템 내부 정보가 노출될 수 있습니다.',
+        '민감정보 localStorage 저장': '클라이언트 측에 민감정보가 저장되어 XSS 공격에 취약합니다.',
+        '인라인 스크립트에 민감정보': '소스 코드에 민감정보가 노출됩니다.'
+    },
+    'low': {
+        '비밀번호 autocomplete disabled': '사용자 경험을 저해하고 강제적인 비밀번호 관리를 유발할 수 있습니다.',
+        '디버깅 정보 노출 가능성': '개발 관련 정보가 노출될 수 있습니다.'
+    }
+}
+
+# 보안 분석 시트 상태 강조
+STATUS_HIGHLIGHT = {"양호": 'status_good', "취약": 'status_bad'}
+
+# 취약점 상세 시트 위험도별 구역 (키, 제목, 부제목 스타일)
+SEVERITY_SECTIONS = (
+    ('high', "🔴 높음 위험도 취약점", 'section_high'),
+    ('medium', "🟡 중간 위험도 취약점", 'section_medium'),
+    ('low', "🟢 낮음 위험도 취약점", 'section_low'),
+)
+
+
+def generate_page_recommendations(page: Dict[str, Any]) -> List[Dict[str, str]]:
+    """페이지 분석 결과 기반 권장 사항 생성"""
+    recommendations = []
+    security = page.get('security', {})
+
+    # HTTPS 권장
+    if not security.get('isHTTPS'):
+        recommendations.append({
+            'priority': '높음',
+            'recommendation': 'HTTPS 적용',
+            'how_to': 'SSL/TLS 인증서 설치 및 모든 HTTP 요청을 HTTPS로 리다이렉트',
+            'benefit': '데이터 전송 암호화 및 사용자 신뢰도 향상'
+        })
+
+    # Mixed Content 해결
+    if security.get('totalMixedContent', 0) > 0:
+        recommendations.append({
+            'priority': '중간',
+            'recommendation': 'Mixed Content 제거',
+            'how_to': '모든 HTTP 리소스를 HTTPS로 변경',
+            'benefit': '브라우저 보안 경고 제거 및 데이터 무결성 보장'
+        })
+
+    # CSP 설정
+    if not security.get('cspMeta'):
+        recommendations.append({
+            'priority': '중간',
+            'recommendation': 'Content Security Policy 설정',
+            'how_to': 'CSP 헤더 또는 meta 태그를 통해 허용된 리소스 소스 지정',
+            'benefit': 'XSS 및 인젝션 공격 방지'
+        })
+
+    # 폼 보안 강화
+    for form in page.get('forms', []):
+        if form.get('method') == 'GET' and any(field.get('isPassword') for field in form.get('fields', [])):
+            recommendations.append({
+                'priority': '높음',
+                'recommendation': '폼 전송 방식을 POST로 변경',
+                'how_to': 'form 태그의 method 속성을 POST로 변경',
+                'benefit': '민감정보가 URL이나 서버 로그에 노출되지 않음'
+            })
+            break
+
+    return recommendations
+
+
+# 상세 시트 분할 계획
+def _detail_group_key(by: str):
+    """상세 행 튜플 -> 분할 기준 값 (menu: 메뉴, host: URL 호스트, URL 별 호스트는 한 번만 해석)"""
+    if by == "menu":
+        menu_col = FINDING_COLUMNS.index("메뉴")
+        return lambda row: str(row[menu_col]) or "(메뉴 없음)"
+
+    url_col = FINDING_COLUMNS.index("URL")
+    hosts = {}
+
+    def host(row):
+        url = row[url_col]
+        if url not in hosts:
+            try:
+                hosts[url] = urlsplit(str(url)).hostname or "(호스트 없음)"
+            except ValueError:
+                hosts[url] = "(호스트 없음)"
+        return hosts[url]
+    return host
+
+
+def _sheet_title(name: str, used: set) -> str:
+    """Excel 시트 이름 규칙에 맞는 고유한 이름 (금지 문자 치환, 31자 제한)"""
+    base = name.translate(SHEET_TITLE_INVALID).strip("'") or "시트"
+    title = base[:SHEET_TITLE_MAX_LENGTH]
+    number = 2
+    while title.lower() in used:
+        suffix = f" ({number})"
+        title = base[:SHEET_TITLE_MAX_LENGTH - len(suffix)] + suffix
+        number += 1
+    used.add(title.lower())
+    return title
+
+
+def plan_detail_parts(report: ExcelReportGenerator, output_filename: Optional[str] = None) -> Optional[List[Dict]]:
+    """상세 행 분할 계획 (나눌 필요가 없으면 None)
+
+    나뉜 시트마다 {'title', 'by', 'group', 'start', 'stop', 'rows'} 를 반환하며 상세 시트 빌더는
+    (분할 기준 값이 group 인 행 중) start 번째부터 stop 번째 전까지의 행만 기록
+    별도 파일로 나누면 'workbook' (파일 이름) 과 'workbook_path' (저장 경로) 추가
+    """
+    by = report.detail_split_by
+    max_rows = report.detail_max_rows
+    if by is None:
+        total = report.statistics['total']
+        if total <= max_rows:
+            return None
+        groups = {None: total}
+    else:
+        # 분할 기준 값별 행 수 (최초 등장 순서)
+        key = _detail_group_key(by)
+        groups = {}
+        for row in report._iter_detail_rows():
+            group = key(row)
+            groups[group] = groups.get(group, 0) + 1
+
+    # 등록된 다른 시트 이름과도 겹치지 않게 함
+    used = {spec['title'].lower() for spec in SHEET_REGISTRY.values()}
+    base_title = SHEET_REGISTRY["menu_details"]['title']
+    parts = []
+    for group, count in groups.items():
+        chunks = range(0, count, max_rows)
+        for number, start in enumerate(chunks, 1):
+            name = base_title if group is None else group
+            if len(chunks) > 1 or group is None:
+                name = f"{name} {number}"
+            parts.append({'title': _sheet_title(name, used), 'by': by, 'group': group,
+                          'start': start, 'stop': min(start + max_rows, count), 'rows': min(max_rows, count - start)})
+
+    if report.detail_workbooks:
+        stem = os.path.splitext(output_filename or "web_security_analysis.xlsx")[0]
+        for number, part in enumerate(parts, 1):
+            part['workbook_path'] = f"{stem}_details_{number:03d}.xlsx"
+            part['workbook'] = os.path.basename(part['workbook_path'])
+    return parts
+
+
+def expand_detail_sheets(report: ExcelReportGenerator, output_filename: str) -> Optional[List[tuple]]:
+    """상세 시트 확장 (나뉘면 목차 시트 + 나뉜 상세 시트)"""
+    parts = plan_detail_parts(report, output_filename)
+    if parts is None:
+        return None
+    index = {'parts': [{name: value for name, value in part.items() if name != 'workbook_path'}
+                       for part in parts]}
+    return ([("detail_index", SHEET_REGISTRY["detail_index"]['title'], index)]
+            + [("menu_details", part['title'], part) for part in parts])
+
+
+# 시트 빌더
+@register_sheet("menu_details", "메뉴별 상세 분석", expand=expand_detail_sheets)
+def build_menu_details_sheet(report: ExcelReportGenerator, ws, part: Dict[str, Any] = None):
+    """메뉴별 상세 분석 시트 (분석 행 전체, 나뉜 시트는 part 범위의 행만)"""
+    from openpyxl.utils import get_column_letter
+
+    # 헤더 행 정의
+    headers = FINDING_COLUMNS
+
+    # 셀 고정 (헤더 행까지, 열 너비는 기록하면서 측정)
+    ws.freeze_panes = f"A{DETAIL_HEADER_ROWS + 1}"
+
+    # 제목
+    report._add_title(ws, "메뉴별 웹 보안 상세 분석")
+
+    # 헤더 추가 (한글 폰트 지원)
+    report._write_row(ws, report.current_row,
+                      [report._normalize_text(header) for header in headers],
+                      ['report_header'] * len(headers))
+    report.current_row += 1
+
+    # 열별 데이터 스타일
+    column_styles = []
+    for header in headers:
+        if header in ["메뉴", "요소유형", "취약점종류", "위험도", "인증필요"]:
+            column_styles.append('body_center')
+        elif header in ["상세설명", "권장조치"]:
+            column_styles.append('body_wrap')
+        else:
+            column_styles.append('body')
+    severity_col = headers.index("위험도")
+
+    rows = report._iter_detail_rows()
+    if part is not None:
+        if part['by'] is not None:
+            key = _detail_group_key(part['by'])
+            rows = (row for row in rows if key(row) == part['group'])
+        rows = islice(rows, part['start'], part['stop'])
+
+    # 데이터 행 추가 (한글 인코딩 지원)
+    header_row = report.current_row - 1
+    for row_values in rows:
+        values = [report._normalize_text(value) for value in row_values]
+
+        # 위험도에 따른 색상 지정
+        styles = column_styles
+        severity_style = SEVERITY_STYLES.get(str(values[severity_col]).upper())
+        if severity_style is not None:
+            styles = list(column_styles)
+            styles[severity_col] = severity_style
+
+        report._write_row(ws, report.current_row, values, styles)
+        report.current_row += 1
+
+    # 필터 추가 (헤더 행부터)
+    ws.auto_filter.ref = f"A{header_row}:{get_column_letter(len(headers))}{report.current_row - 1}"
+
+
+@register_sheet("detail_index", "상세 분석 목차")
+def build_detail_index_sheet(report: ExcelReportGenerator, ws, part: Dict[str, Any] = None):
+    """상세 분석 목차 시트 (나뉜 상세 시트/파일 목록과 바로가기 링크)"""
+    from openpyxl.utils.cell import quote_sheetname
+
+    if part is None:
+        parts = plan_detail_parts(report) or [{'title': SHEET_REGISTRY["menu_details"]['title'], 'by': None,
+                                               'group': None, 'start': 0, 'stop': report.statistics['total'],
+                                               'rows': report.statistics['total']}]
+    else:
+        parts = part['parts']
+    linked = any('workbook' in item for item in parts)
+
+    headers = ["시트", "구분", "행 범위", "행 수"] + (["파일"] if linked else [])
+    report._add_title(ws, "메뉴별 상세 분석 목차")
+    by = parts[0]['by']
+    basis = f"{DETAIL_SPLIT_KEYS[by]}별로" if by else "행 수 기준으로"
+    report._add_note(ws, f"상세 행 {sum(item['rows'] for item in parts)}건을 {basis} {len(parts)}개 "
+                         f"{'파일' if linked else '시트'}로 분할 (시트당 최대 {report.detail_max_rows}행)")
+
+    report._write_row(ws, report.current_row, headers, ['table_header'] * len(headers))
+    report.current_row += 1
+    for item in parts:
+        location = f"{quote_sheetname(item['title'])}!A1"
+        link = {'target': item['workbook'], 'location': location} if linked else {'location': location}
+        values = [item['title'], item['group'] if item['group'] is not None else "전체",
+                  f"{item['start'] + 1} - {item['stop']}", item['rows']]
+        if linked:
+            values.append(item['workbook'])
+        report._write_row(ws, report.current_row, values, ['body'] * len(values),
+                          links=[link] + [None] * (len(values) - 1))
+        report.current_row += 1
+
+
+@register_sheet("summary", "요약 정보")
+def build_summary_sheet(report: ExcelReportGenerator, ws):
+    """요약 정보 시트 (페이지 분석 결과가 있으면 페이지 요약, 없으면 분석 행 집계 요약)"""
+    # 제목
+    report._add_title(ws, "웹 보안 분석 보고서 요약")
+
+    # 현재 한국 시간으로 날짜 생성
+    kst = datetime.now() + timedelta(hours=9)
+    page = report.page
+    if not page:
+        summary_data = [
+            ["분석 대상", "웹사이트 전체"],
+            ["분석 시간", kst.strftime("%Y-%m-%d %H:%M:%S")],
+            ["총 분석 항목", report.statistics['total']],
+            ["분석 방식", "Chrome DevTools + 패턴 분석"],
+        ]
+
+        # 위험도별 통계
+        severity_stats = report.statistics['severity']
+        summary_data.extend([
+            ["HIGH 위험도 취약점", severity_stats["HIGH"]],
+            ["MEDIUM 위험도 취약점", severity_stats["MEDIUM"]],
+            ["LOW 위험도 취약점", severity_stats["LOW"]],
+            ["총 취약점", sum(severity_stats.values())]
+        ])
+        report._add_table(ws, summary_data, start_col=1, start_row=report.current_row)
+        return
+
+    basic_info = page.get('basic_info', {})
+    security_info = page.get('security', {})
+    summary_data = [
+        ["분석 대상 URL", basic_info.get('url', 'N/A')],
+        ["사이트 제목", basic_info.get('title', 'N/A')],
+        ["분석 시간", kst.strftime("%Y-%m-%d %H:%M:%S")],
+        ["프로토콜", basic_info.get('protocol', 'N/A')],
+        ["HTTPS 사용", "예" if security_info.get('isHTTPS') else "아니오"],
+        ["Mixed Content", f"{security_info.get('totalMixedContent', 0)}개"],
+        ["총 폼 수", len(page.get('forms', []))],
+        ["내부 링크 수", page.get('navigation', {}).get('internalLinks', 0)],
+        ["외부 링크 수", page.get('navigation', {}).get('externalLinks', 0)],
+        ["콘솔 오류 수", page.get('console', {}).get('errorCount', 0)],
+        ["콘솔 경고 수", page.get('console', {}).get('warningCount', 0)],
+    ]
+    report._add_table(ws, summary_data, start_col=1, start_row=report.current_row)
+
+    # 취약점 요약
+    report._add_subtitle(ws, "취약점 요약")
+    vulnerabilities = page.get('vulnerabilities', {})
+    counts = [len(vulnerabilities.get(level, [])) for level in ('high', 'medium', 'low')]
+    total = sum(counts)
+    vuln_data = [["위험도", "개수", "비율"]]
+    for label, count in zip(("높음 (High)", "중간 (Medium)", "낮음 (Low)"), counts):
+        vuln_data.append([label, count, f"{count / total * 100:.1f}%" if total > 0 else ""])
+    vuln_data.append(["총계", total, "100%"])
+    report._add_table(ws, vuln_data)
+
+
+@register_sheet("vulnerability_summary", "취약점 요약")
+def build_vulnerability_summary_sheet(report: ExcelReportGenerator, ws):
+    """취약점 요약 시트 (위험도/취약점 종류/권장 조치 집계)"""
+    # 제목
+    report._add_title(ws, "취약점 종류별 요약")
+
+    # 취약점 종류별 통계
+    stats = report.statistics
+    severity_stats = stats['severity']
+    type_stats = stats['types']
+
+    # 위험도별 통계 테이블
+    report._add_subtitle(ws, "위험도별 분포")
+
+    severity_data = [
+        ["위험도", "개수", "비율(%)"],
+        ["HIGH", severity_stats["HIGH"], ""],
+        ["MEDIUM", severity_stats["MEDIUM"], ""],
+        ["LOW", severity_stats["LOW"], ""],
+        ["총계", sum(severity_stats.values()), "100.0"]
+    ]
+
+    # 비율 계산
+    total = sum(severity_stats.values())
+    if total > 0:
+        severity_data[1][2] = f"{severity_stats['HIGH']/total*100:.1f}"
+        severity_data[2][2] = f"{severity_stats['MEDIUM']/total*100:.1f}"
+        severity_data[3][2] = f"{severity_stats['LOW']/total*100:.1f}"
+
+    report._add_table(ws, severity_data)
+
+    # 취약점 종류별 통계
+    type_data = []
+    if type_stats:
+        report.current_row += len(severity_data) + 2
+        report._add_subtitle(ws, "취약점 종류별 분포")
+
+        type_data = [["취약점 종류", "개수"]]
+        for vuln_type, count in sorted(type_stats.items(), key=lambda x: x[1], reverse=True):
+            type_data.append([vuln_type, count])
+
+        report._add_table(ws, type_data)
+
+    # 권장 조치 요약
+    report.current_row += len(type_data) + 2
+    report._add_subtitle(ws, "주요 권장 조치")
+
+    recommendations = stats['recommendations']
+    if recommendations:
+        rec_data = [["권장 조치", "발생 빈도"]]
+        for action, count in sorted(recommendations.items(), key=lambda x: x[1], reverse=True)[:10]:
+            rec_data.append([action, count])
+
+        report._add_table(ws, rec_data)
+
+
+@register_sheet("basic_info", "기본 정보")
+def build_basic_info_sheet(report: ExcelReportGenerator, ws):
+    """기본 정보 시트"""
+    report._add_title(ws, "웹사이트 기본 정보")
+
+    basic_info = report.page.get('basic_info', {})
+    report._add_table(ws, [
+        ["항목", "값"],
+        ["URL", basic_info.get('url', 'N/A')],
+        ["도메인", basic_info.get('domain', 'N/A')],
+        ["프로토콜", basic_info.get('protocol', 'N/A')],
+        ["포트", basic_info.get('port', 'N/A')],
+        ["경로", basic_info.get('path', 'N/A')],
+        ["제목", basic_info.get('title', 'N/A')],
+        ["언어", basic_info.get('language', 'N/A')],
+        ["플랫폼", basic_info.get('platform', 'N/A')],
+        ["User Agent", basic_info.get('userAgent', 'N/A')],
+        ["문자셋", basic_info.get('characterSet', 'N/A')],
+        ["레퍼러", basic_info.get('referrer', 'N/A')],
+        ["쿠키 사용 가능", "예" if basic_info.get('cookieEnabled') else "아니오"],
+        ["온라인 상태", "예" if basic_info.get('onLine') else "아니오"],
+    ])
+
+
+@register_sheet("security", "보안 분석")
+def build_security_sheet(report: ExcelReportGenerator, ws):
+    """보안 분석 시트 (HTTPS, Mixed Content, CSP, 외부 리소스)"""
+    report._add_title(ws, "HTTPS 및 보안 설정 분석")
+
+    security = report.page.get('security', {})
+    mixed_count = security.get('totalMixedContent', 0)
+    security_data = [
+        ["항목", "상태", "설명"],
+        ["HTTPS 사용", "양호" if security.get('isHTTPS') else "취약",
+         "HTTPS를 사용하면 데이터 전송이 암호화됩니다" if security.get('isHTTPS') else
+         "HTTP를 사용하면 데이터가 평문으로 전송됩니다"],
+        ["Mixed Content", "양호" if mixed_count == 0 else "취약",
+         "Mixed Content가 없습니다" if mixed_count == 0 else f"{mixed_count}개의 HTTP 리소스가 있습니다"],
+    ]
+
+    # Mixed Content 상세
+    mixed_content = security.get('mixedContent', {})
+    if mixed_content:
+        security_data.extend([
+            ["  - HTTP 이미지", mixed_content.get('httpImages', 0), "개"],
+            ["  - HTTP 스크립트", mixed_content.get('httpScripts', 0), "개"],
+            ["  - HTTP 스타일시트", mixed_content.get('httpStyles', 0), "개"],
+            ["  - HTTP 아이프레임", mixed_content.get('httpIframes', 0), "개"],
+        ])
+    report._add_table(ws, security_data, highlight=STATUS_HIGHLIGHT)
+
+    # CSP 확인
+    report._add_subtitle(ws, "Content Security Policy (CSP)")
+    csp_info = security.get('cspMeta', "설정되지 않음")
+    report._add_table(ws, [
+        ["CSP 설정", csp_info],
+        ["보안 등급", "양호" if csp_info and csp_info != "설정되지 않음" else "주의 필요"]
+    ], highlight=STATUS_HIGHLIGHT)
+
+    # 외부 리소스 분석
+    if security.get('externalResources'):
+        report._add_subtitle(ws, "외부 리소스 분석")
+        external_data = [["태그", "URL", "외부 도메인", "HTTP 여부", "Integrity"]]
+        for resource in security['externalResources'][:20]:  # 최대 20개만 표시
+            external_data.append([
+                resource.get('tagName', ''),
+                resource.get('url', ''),
+                resource.get('isExternal', ''),
+                "예" if resource.get('isHTTP') else "아니오",
+                resource.get('integrity', '')
+            ])
+        report._add_table(ws, external_data)
+
+
+@register_sheet("forms", "폼 분석")
+def build_forms_sheet(report: ExcelReportGenerator, ws):
+    """폼 분석 시트 (폼별 속성, 입력 필드, 잠재적 취약점)"""
+    report._add_title(ws, "웹 폼 및 입력 필드 분석")
+
+    forms = report.page.get('forms', [])
+    if not forms:
+        report._add_note(ws, "폼이 발견되지 않았습니다.")
+        return
+
+    for i, form in enumerate(forms):
+        # 폼 기본 정보
+        report._add_subtitle(ws, f"폼 #{i+1}: {form.get('action', 'N/A')}")
+        report._add_table(ws, [
+            ["속성", "값"],
+            ["Action", form.get('action', 'N/A')],
+            ["Method", form.get('method', 'N/A')],
+            ["ID", form.get('id', 'N/A')],
+            ["Class", form.get('className', 'N/A')],
+            ["Encoding", form.get('enctype', 'N/A')],
+            ["CSRF 토큰", form.get('csrfToken', '없음')],
+        ])
+
+        # 입력 필드 정보
+        fields = form.get('fields', [])
+        if fields:
+            report._add_subtitle(ws, f"입력 필드 ({len(fields)}개)")
+
+            field_data = [["타입", "이름", "ID", "필수", "자동완성", "최대길이", "보안 관련"]]
+            for field in fields:
+                security_notes = []
+                if field.get('isPassword'):
+                    security_notes.append("비밀번호")
+                if field.get('isEmail'):
+                    security_notes.append("이메일")
+                if field.get('isFile'):
+                    security_notes.append("파일업로드")
+                if field.get('isHidden'):
+                    security_notes.append("숨김필드")
+
+                field_data.append([
+                    field.get('type', ''),
+                    field.get('name', ''),
+                    field.get('id', ''),
+                    "예" if field.get('required') else "아니오",
+                    field.get('autocomplete', ''),
+                    field.get('maxlength', '') if field.get('maxlength') != -1 else '제한없음',
+                    ", ".join(security_notes) if security_notes else "-"
+                ])
+            report._add_table(ws, field_data)
+
+        # 잠재적 취약점
+        vulnerabilities = form.get('potentialVulnerabilities', [])
+        if vulnerabilities:
+            report._add_subtitle(ws, "잠재적 취약점")
+            vuln_data = [["유형", "필드", "위험도"]]
+            for vuln in vulnerabilities:
+                vuln_data.append([vuln.get('type', ''), vuln.get('field', ''), vuln.get('severity', '')])
+            report._add_table(ws, vuln_data)
+
+        report.current_row += 1
+
+
+@register_sheet("navigation", "내비게이션 분석")
+def build_navigation_sheet(report: ExcelReportGenerator, ws):
+    """내비게이션 분석 시트 (링크 통계, 메뉴 구조, 외부 링크)"""
+    report._add_title(ws, "링크 및 내비게이션 구조 분석")
+
+    nav = report.page.get('navigation', {})
+
+    # 전체 링크 통계
+    report._add_table(ws, [
+        ["항목", "개수"],
+        ["전체 링크", nav.get('totalLinks', 0)],
+        ["내부 링크", nav.get('internalLinks', 0)],
+        ["외부 링크", nav.get('externalLinks', 0)],
+        ["앵커 링크", nav.get('anchorLinks', 0)],
+        ["JavaScript 링크", nav.get('javascriptLinks', 0)],
+        ["메일to 링크", nav.get('mailtoLinks', 0)],
+        ["전화 링크", nav.get('telLinks', 0)],
+    ])
+
+    # 내비게이션 메뉴 구조
+    nav_menus = nav.get('navMenus', [])
+    if nav_menus:
+        report._add_subtitle(ws, "내비게이션 메뉴 구조")
+
+        for i, menu in enumerate(nav_menus[:5]):  # 최대 5개 메뉴만 표시
+            report._add_subtitle(ws, f"메뉴 #{i+1}: {menu.get('className', 'N/A')}")
+
+            menu_data = [["텍스트", "URL", "내부 링크 여부"]]
+            for link in menu.get('links', [])[:10]:  # 메뉴당 최대 10개 링크
+                menu_data.append([
+                    link.get('text', ''),
+                    link.get('href', ''),
+                    "예" if link.get('isInternal') else "아니오"
+                ])
+            report._add_table(ws, menu_data)
+
+    # 외부 링크 상세
+    external_links = [link for link in nav.get('allLinks', []) if link.get('isExternal')]
+    if external_links:
+        report._add_subtitle(ws, "외부 링크 목록 (최대 20개)")
+
+        ext_data = [["텍스트", "URL", "Target", "Rel"]]
+        for link in external_links[:20]:
+            ext_data.append([link.get('text', ''), link.get('href', ''), link.get('target', ''), link.get('rel', '')])
+        report._add_table(ws, ext_data)
+
+
+def _storage_items_table(storage: Dict[str, Any]) -> List[list]:
+    """웹 스토리지 항목 표 (최대 15개, 값은 앞 50자만)"""
+    data = [["키", "크기", "값 (일부)"]]
+    for key, info in list(storage.get('items', {}).items())[:15]:
+        value = str(info.get('value', ''))
+        data.append([key, info.get('size', 0), value[:50] + "..." if len(value) > 50 else value])
+    return data
+
+
+@register_sheet("storage", "스토리지 분석")
+def build_storage_sheet(report: ExcelReportGenerator, ws):
+    """스토리지 분석 시트 (쿠키, localStorage, sessionStorage, 민감정보)"""
+    report._add_title(ws, "쿠키 및 웹 스토리지 분석")
+
+    storage = report.page.get('storage', {})
+
+    # 쿠키 정보
+    cookies = storage.get('cookies', {})
+    report._add_subtitle(ws, f"쿠키 ({cookies.get('count', 0)}개)")
+    cookie_data = [["이름", "크기", "도메인"]]
+    for cookie in cookies.get('items', [])[:20]:  # 최대 20개 쿠키
+        cookie_data.append([cookie.get('name', ''), cookie.get('size', 0), cookie.get('domain', '')])
+    report._add_table(ws, cookie_data)
+
+    # localStorage / sessionStorage
+    for key, label in (('localStorage', "Local Storage"), ('sessionStorage', "Session Storage")):
+        web_storage = storage.get(key, {})
+        report._add_subtitle(ws, f"{label} ({web_storage.get('count', 0)}개, {web_storage.get('totalSize', 0)} bytes)")
+        report._add_table(ws, _storage_items_table(web_storage))
+
+    # 민감정보 저장 확인
+    sensitive_data = storage.get('sensitiveData', [])
+    if sensitive_data:
+        report._add_subtitle(ws, "⚠️ 민감정보 저장 현황")
+        sensitive_table = [["저장소", "키", "패턴", "크기"]]
+        for item in sensitive_data:
+            sensitive_table.append([item.get('container', ''), item.get('key', ''),
+                                    item.get('pattern', ''), item.get('size', 0)])
+        report._add_table(ws, sensitive_table)
+
+
+@register_sheet("network", "네트워크 분석")
+def build_network_sheet(report: ExcelReportGenerator, ws):
+    """네트워크 분석 시트 (요청 통계, 타입별 요청, API 엔드포인트, 잠재적 취약점)"""
+    report._add_title(ws, "네트워크 요청 분석")
+
+    network = report.page.get('network', {})
+
+    # 네트워크 통계
+    report._add_table(ws, [
+        ["항목", "개수"],
+        ["총 요청", network.get('total', 0)],
+        ["HTTPS 요청", network.get('httpsRequests', 0)],
+        ["HTTP 요청", network.get('httpRequests', 0)],
+        ["내부 요청", network.get('internalRequests', 0)],
+        ["외부 요청", network.get('externalRequests', 0)],
+        ["API 엔드포인트", len(network.get('apiEndpoints', []))],
+    ])
+
+    # 요청 타입별 분석
+    by_type = network.get('byType', {})
+    if by_type:
+        report._add_subtitle(ws, "요청 타입별 분석")
+        report._add_table(ws, [["타입", "개수"]] + [[req_type, count] for req_type, count in by_type.items()])
+
+    # API 엔드포인트
+    api_endpoints = network.get('apiEndpoints', [])
+    if api_endpoints:
+        report._add_subtitle(ws, "API 엔드포인트")
+        api_data = [["URL", "메소드", "타입"]]
+        for endpoint in api_endpoints[:20]:  # 최대 20개
+            api_data.append([endpoint.get('url', ''), endpoint.get('method', ''), endpoint.get('type', '')])
+        report._add_table(ws, api_data)
+
+    # 잠재적 취약점
+    potential_vulns = network.get('potentialVulnerabilities', [])
+    if potential_vulns:
+        report._add_subtitle(ws, "⚠️ 잠재적 네트워크 취약점")
+        vuln_data = [["유형", "URL", "메소드"]]
+        for vuln in potential_vulns:
+            vuln_data.append([vuln.get('type', ''), vuln.get('url', ''), vuln.get('method', '')])
+        report._add_table(ws, vuln_data)
+
+
+@register_sheet("vulnerabilities", "취약점 상세")
+def build_vulnerabilities_sheet(report: ExcelReportGenerator, ws):
+    """취약점 상세 시트 (페이지 분석 결과의 위험도별 취약점)"""
+    report._add_title(ws, "보안 취약점 상세 분석")
+
+    vulnerabilities = report.page.get('vulnerabilities', {})
+    found = False
+    for level, title, style in SEVERITY_SECTIONS:
+        items = vulnerabilities.get(level, [])
+        if not items:
+            continue
+        found = True
+        report._add_subtitle(ws, title, style=style)
+        data = [["#", "취약점", "설명"]]
+        for i, vuln in enumerate(items, 1):
+            data.append([i, vuln, VULNERABILITY_DESCRIPTIONS.get(level, {}).get(vuln, '상세 설명 준비 중...')])
+        report._add_table(ws, data)
+
+    if not found:
+        report._add_note(ws, "발견된 취약점이 없습니다.")
+
+
+@register_sheet("recommendations", "권장 사항")
+def build_recommendations_sheet(report: ExcelReportGenerator, ws):
+    """권장 사항 시트"""
+    report._add_title(ws, "보안 강화 권장 사항")
+
+    recommendations = report.page_recommendations
+    if not recommendations:
+        report._add_note(ws, "현재 상태가 양호하여 추가 권장 사항이 없습니다.")
+        return
+
+    rec_data = [["우선순위", "권장 사항", "적용 방법", "예상 효과"]]
+    for rec in recommendations:
+        rec_data.append([rec.get('priority', ''), rec.get('recommendation', ''),
+                         rec.get('how_to', ''), rec.get('benefit', '')])
+    report._add_table(ws, rec_data)
+
+
 def main():
     """테스트용 메인 함수"""
     # 새로운 형식의 테스트 데이터
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 결과 기계 판독용 내보내기
+메뉴별 상세 분석 행을 엑셀을 거치지 않고 CSV / JSON Lines / Parquet 로 기록
+(SIEM 등 수집 파이프라인용)
+"""
+
+import csv
+import importlib.util
+import json
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Dict, Any, Iterable
+
+from findings_table import FINDING_COLUMNS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 행 단위로 기록하는 형식 (한 번 순회하며 동시에 기록)
+TEXT_FORMATS = ("csv", "jsonl")
+EXPORT_FORMATS = TEXT_FORMATS + ("parquet",)
+
+
+def parquet_available() -> bool:
+    """Parquet 내보내기 가능 여부 (pyarrow 설치 여부, Parquet 는 pyarrow 설치 시에만 지원)
+
+    pyarrow 는 import 비용이 커서 설치 여부만 확인하고 실제 import 는 기록할 때 수행
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def write_text_exports(rows: Iterable[Dict[str, Any]], paths: Dict[str, str]) -> int:
+    """분석 행을 CSV/JSONL 파일에 스트리밍 기록 (행 목록은 한 번만 순회)
+
+    paths 는 형식("csv", "jsonl") -> 출력 경로, 기록한 행 수 반환
+    """
+    count = 0
+    with ExitStack() as stack:
+        csv_writer = None
+        jsonl_file = None
+        if "csv" in paths:
+            # 엑셀에서 열어도 한글이 깨지지 않도록 BOM 포함
+            csv_file = stack.enter_context(open(paths["csv"], "w", encoding="utf-8-sig", newline=""))
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(FINDING_COLUMNS)
+        if "jsonl" in paths:
+            jsonl_file = stack.enter_context(open(paths["jsonl"], "w", encoding="utf-8"))
+
+        for row in rows:
+            values = ["" if row.get(name) is None else row.get(name) for name in FINDING_COLUMNS]
+            if csv_writer is not None:
+                csv_writer.writerow(values)
+            if jsonl_file is not None:
+                jsonl_file.write(json.dumps(dict(zip(FINDING_COLUMNS, values)), ensure_ascii=False, default=str))
+                jsonl_file.write("\n")
+            count += 1
+    return count
+
+
+def write_parquet(frame: "pd.DataFrame", path: str) -> str:
+    """컬럼형 분석 결과를 Parquet 로 기록 (category 열은 사전 인코딩으로 저장)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet 내보내기에는 pyarrow 가 필요합니다 (pip install pyarrow)")
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    pq.write_table(table, path, compression="snappy")
+    return path
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 결과 추가 전용 로그
+분석 중 페이지 단위로 메뉴별 상세 분석 행을 JSON Lines 파일에 바로 기록하고,
+보고서 생성 시 전체 목록을 메모리에 올리지 않고 파일을 다시 순회하며 읽음
+SKILL.md 의 크롤링(페이지 상태 + 행), 오프라인 분석, 보고서 CLI 가 모두 이 모듈로 기록하고 읽음
+"""
+
+import json
+import os
+from typing import Dict, List, Any, Iterator, Optional
+
+
+def truncate_partial_line(path: str):
+    """추가 전용 JSONL 파일을 마지막 완전한 줄까지 자름 (중단되어 잘린 마지막 줄 뒤에 이어서 기록하지 않도록)"""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        size = end = f.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+        if end < size:
+            f.truncate(end)
+
+
+class FindingsLog:
+    """분석 행 추가 전용 로그 기록기 (한 줄에 페이지 하나: {"index", "rows", 페이지 필드...})
+
+    append 이면 잘린 마지막 줄을 지우고 기존 기록의 가장 큰 index 다음 번호부터 이어서 기록
+    기록할 때마다 파일 버퍼를 비우고, 디스크 반영(fsync)은 sync 또는 close 에서 수행
+    """
+
+    def __init__(self, path: str, append: bool = False):
+        self.path = path
+        self.pages = 0
+        if append and os.path.exists(path):
+            truncate_partial_line(path)
+            for record in iter_log_records(path):
+                self.pages = max(self.pages, record.get("index", -1) + 1)
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def append(self, rows: List[Dict[str, Any]], index: Optional[int] = None, **page_fields):
+        """페이지 하나의 분석 행 기록 (index 가 같은 기록은 읽을 때 처음 것만 사용)"""
+        index = self.pages if index is None else index
+        record = {"index": index, "rows": rows, **page_fields}
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        self.pages = max(self.pages, index + 1)
+
+    def sync(self):
+        """기록한 행을 디스크에 반영"""
+        if not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_log_records(path: str) -> Iterator[Dict[str, Any]]:
+    """로그의 페이지 기록 순회 (기록 중 중단되어 잘린 마지막 줄과 중복 index 는 제외)"""
+    seen = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            index = record.get("index")
+            if index in seen:
+                continue
+            seen.add(index)
+            yield record
+
+
+def iter_log_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """로그의 분석 행 순회 (기록된 순서)"""
+    for record in iter_log_records(path):
+        yield from record.get("rows", [])
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 결과 컬럼형 저장소
+메뉴별 상세 분석 행(12개 한글 헤더 dict)을 pandas DataFrame 으로 변환하고
+위험도/취약점 종류/권장 조치 통계를 벡터화된 집계로 계산
+(pandas 는 DataFrame 을 만들 때 import 하므로 행 단위 집계만 쓰면 읽지 않음)
+"""
+
+import sys
+from typing import TYPE_CHECKING, Dict, Any, Iterable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 메뉴별 상세 분석 열 순서
+FINDING_COLUMNS = [
+    "메뉴", "URL", "요소유형", "요소명", "파라미터",
+    "HTTP메소드", "취약점종류", "위험도", "상세설명",
+    "패턴", "인증필요", "권장조치"
+]
+
+# 값 종류가 적은 열은 category 로 저장 (행마다 문자열 대신 정수 코드만 보관)
+CATEGORY_COLUMNS = ["요소유형", "HTTP메소드", "취약점종류", "위험도", "패턴", "인증필요", "권장조치"]
+
+# 같은 문자열이 반복되는 열은 intern 하여 문자열 객체 하나를 공유
+INTERNED_COLUMNS = ["메뉴", "URL"]
+
+SEVERITY_LEVELS = ["HIGH", "MEDIUM", "LOW"]
+
+
+def build_findings_frame(rows: Iterable[Dict[str, Any]]) -> "pd.DataFrame":
+    """분석 행 목록을 컬럼형 DataFrame 으로 변환 (한 번 순회, pandas 는 이때 import)"""
+    import pandas as pd
+
+    columns = {name: [] for name in FINDING_COLUMNS}
+    interned = set(INTERNED_COLUMNS)
+
+    for row in rows:
+        for name in FINDING_COLUMNS:
+            value = row.get(name, "")
+            if value is None:
+                value = ""
+            elif name in interned and isinstance(value, str):
+                value = sys.intern(value)
+            columns[name].append(value)
+
+    frame = pd.DataFrame(columns, columns=FINDING_COLUMNS)
+    for name in CATEGORY_COLUMNS:
+        # 카테고리 순서는 최초 등장 순서 유지 (동률 정렬 시 기존 보고서와 같은 순서)
+        frame[name] = pd.Categorical(frame[name], categories=pd.unique(frame[name]))
+    return frame
+
+
+def _category_counts(series: "pd.Series") -> Dict[Any, int]:
+    """카테고리별 건수 (최초 등장 순서, 빈 값 제외)"""
+    counts = series.value_counts(sort=False)
+    return {value: int(count) for value, count in counts.items() if value != "" and count > 0}
+
+
+def summarize_findings(frame: "pd.DataFrame") -> Dict[str, Any]:
+    """위험도/취약점 종류/권장 조치 집계"""
+    # 위험도는 대소문자 구분 없이 집계 (카테고리 수 만큼만 문자열 변환)
+    severity_counts = frame["위험도"].value_counts(sort=False)
+    severity_counts = severity_counts.groupby(severity_counts.index.astype(str).str.upper()).sum()
+
+    return {
+        'total': len(frame),
+        'severity': {level: int(severity_counts.get(level, 0)) for level in SEVERITY_LEVELS},
+        'types': _category_counts(frame["취약점종류"]),
+        'recommendations': _category_counts(frame["권장조치"])
+    }
+
+
+def summarize_finding_rows(rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """summarize_findings 와 같은 집계를 행을 한 번 순회하며 계산 (행 목록을 메모리에 두지 않음)"""
+    total = 0
+    severity = {level: 0 for level in SEVERITY_LEVELS}
+    types: Dict[Any, int] = {}
+    recommendations: Dict[Any, int] = {}
+
+    for row in rows:
+        total += 1
+        level = str(row.get("위험도") or "").upper()
+        if level in severity:
+            severity[level] += 1
+        for counts, name in ((types, "취약점종류"), (recommendations, "권장조치")):
+            value = row.get(name)
+            if value not in (None, ""):
+                counts[value] = counts.get(value, 0) + 1
+
+    return {'total': total, 'severity': severity, 'types': types, 'recommendations': recommendations}
+
+
+def iter_finding_rows(frame: "pd.DataFrame") -> Iterable[tuple]:
+    """FINDING_COLUMNS 순서의 행 튜플 순회"""
+    return frame.itertuples(index=False, name=None)
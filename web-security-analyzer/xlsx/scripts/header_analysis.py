@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+응답 헤더 보안 분석
+문서 응답의 보안 헤더(CSP, HSTS, X-Frame-Options, X-Content-Type-Options, Referrer-Policy)와
+Set-Cookie 속성을 판정 (추가 요청 없음)
+
+SKILL.md 의 페이지 분석(analyze_page_headers), HAR 오프라인 분석, website_security_analysis 보고서가
+모두 이 모듈을 import 하여 같은 판정을 사용
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple
+from urllib.parse import urlsplit
+
+SECURITY_HEADER_NAMES = (
+    'content-security-policy', 'content-security-policy-report-only', 'strict-transport-security',
+    'x-frame-options', 'x-content-type-options', 'referrer-policy'
+)
+HSTS_MIN_MAX_AGE = 180 * 24 * 3600  # HSTS max-age 권장 최소값(초)
+SESSION_COOKIE_PATTERN = re.compile(r'sess|sid|auth|token|jwt|login', re.I)
+
+
+def normalize_response_headers(raw: Any) -> Dict[str, List[str]]:
+    """응답 헤더를 {소문자 이름: [값, ...]} 로 변환 (dict 또는 [{name, value}] 목록, 줄바꿈으로 합쳐진 값 지원)"""
+    items = raw.items() if isinstance(raw, dict) else ((h.get('name', ''), h.get('value', '')) for h in raw or [])
+    headers: Dict[str, List[str]] = {}
+    for name, value in items:
+        values = value if isinstance(value, list) else str(value).split('\n')
+        headers.setdefault(name.lower(), []).extend(v.strip() for v in values if v.strip())
+    return headers
+
+
+def parse_set_cookie(header: str) -> Tuple[str, Dict[str, str]]:
+    """Set-Cookie 값을 (쿠키 이름, {소문자 속성: 값}) 으로 분리"""
+    parts = [part.strip() for part in header.split(';')]
+    name = parts[0].split('=', 1)[0].strip()
+    attributes = {}
+    for part in parts[1:]:
+        if part:
+            key, _, value = part.partition('=')
+            attributes[key.strip().lower()] = value.strip()
+    return name, attributes
+
+
+def analyze_security_headers(url: str, headers: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """보안 헤더(CSP, HSTS, X-Frame-Options, X-Content-Type-Options, Referrer-Policy)와 쿠키 속성 판정"""
+    is_https = url.lower().startswith('https:')
+    findings = []
+
+    def add(vuln_type, severity, element, description, pattern, element_type='header'):
+        findings.append({'type': vuln_type, 'severity': severity, 'element': element, 'elementType': element_type,
+                         'description': description, 'pattern': pattern, 'confidence': 'HIGH'})
+
+    def first(name):
+        values = headers.get(name)
+        return values[0] if values else ''
+
+    # CSP (script-src 가 없으면 default-src 적용)
+    directives = {}
+    for policy in headers.get('content-security-policy', []):
+        for directive in policy.split(';'):
+            tokens = directive.split()
+            if tokens:
+                directives.setdefault(tokens[0].lower(), [token.lower() for token in tokens[1:]])
+    if not directives:
+        if headers.get('content-security-policy-report-only'):
+            add('SECURITY_HEADERS', 'LOW', 'Content-Security-Policy-Report-Only',
+                'CSP 가 보고 전용으로만 설정되어 스크립트를 차단하지 않음', 'csp_report_only')
+        else:
+            add('SECURITY_HEADERS', 'MEDIUM', 'Content-Security-Policy', 'CSP 헤더 부재', 'missing_csp')
+    else:
+        script_sources = directives.get('script-src', directives.get('default-src'))
+        if script_sources is None:
+            add('SECURITY_HEADERS', 'MEDIUM', 'Content-Security-Policy',
+                'CSP 에 script-src/default-src 지시어 부재', 'csp_no_script_src')
+        else:
+            # nonce/hash 가 있으면 브라우저가 'unsafe-inline' 을 무시
+            has_nonce = any(source.startswith(("'nonce-", "'sha")) for source in script_sources)
+            if "'unsafe-inline'" in script_sources and not has_nonce:
+                add('SECURITY_HEADERS', 'MEDIUM', 'Content-Security-Policy',
+                    "CSP script-src 에 'unsafe-inline' 허용", 'csp_unsafe_inline')
+            if "'unsafe-eval'" in script_sources:
+                add('SECURITY_HEADERS', 'LOW', 'Content-Security-Policy',
+                    "CSP script-src 에 'unsafe-eval' 허용", 'csp_unsafe_eval')
+
+    # HSTS (HTTPS 응답에만 의미 있음)
+    if is_https:
+        hsts = first('strict-transport-security')
+        max_age = re.search(r'max-age\s*=\s*"?(\d+)', hsts, re.I)
+        if not hsts:
+            add('SECURITY_HEADERS', 'MEDIUM', 'Strict-Transport-Security', 'HSTS 헤더 부재', 'missing_hsts')
+        elif not max_age or int(max_age.group(1)) < HSTS_MIN_MAX_AGE:
+            add('SECURITY_HEADERS', 'LOW', 'Strict-Transport-Security',
+                'HSTS max-age 가 180일 미만', 'hsts_short_max_age')
+
+    # 클릭재킹 (CSP frame-ancestors 가 있으면 X-Frame-Options 불필요)
+    if 'frame-ancestors' not in directives and first('x-frame-options').upper() not in ('DENY', 'SAMEORIGIN'):
+        add('SECURITY_HEADERS', 'MEDIUM', 'X-Frame-Options',
+            'X-Frame-Options/frame-ancestors 부재 (클릭재킹 가능)', 'missing_frame_options')
+
+    if first('x-content-type-options').lower() != 'nosniff':
+        add('SECURITY_HEADERS', 'LOW', 'X-Content-Type-Options', 'X-Content-Type-Options: nosniff 부재',
+            'missing_nosniff')
+
+    # Referrer-Policy 는 쉼표로 여러 값을 줄 수 있으며 마지막 값이 적용됨
+    referrer_policy = first('referrer-policy').lower().split(',')[-1].strip()
+    if not referrer_policy:
+        add('SECURITY_HEADERS', 'LOW', 'Referrer-Policy', 'Referrer-Policy 헤더 부재', 'missing_referrer_policy')
+    elif referrer_policy in ('unsafe-url', 'no-referrer-when-downgrade'):
+        add('SECURITY_HEADERS', 'LOW', 'Referrer-Policy',
+            f'Referrer-Policy 가 전체 URL 을 전송 ({referrer_policy})', 'weak_referrer_policy')
+
+    # 쿠키 속성 (이 응답이 설정한 쿠키만, HttpOnly 쿠키는 document.cookie 로 볼 수 없음)
+    for header in headers.get('set-cookie', []):
+        name, attributes = parse_set_cookie(header)
+        secure = 'secure' in attributes
+        if is_https and not secure:
+            add('COOKIE_SECURITY', 'MEDIUM', name, '쿠키에 Secure 속성 부재', 'cookie_missing_secure', 'cookie')
+        if 'httponly' not in attributes:
+            add('COOKIE_SECURITY', 'MEDIUM' if SESSION_COOKIE_PATTERN.search(name) else 'LOW', name,
+                '쿠키에 HttpOnly 속성 부재', 'cookie_missing_httponly', 'cookie')
+        same_site = attributes.get('samesite', '').lower()
+        if not same_site:
+            add('COOKIE_SECURITY', 'LOW', name, '쿠키에 SameSite 속성 부재', 'cookie_missing_samesite', 'cookie')
+        elif same_site == 'none' and not secure:
+            add('COOKIE_SECURITY', 'MEDIUM', name, 'SameSite=None 쿠키에 Secure 속성 부재',
+                'cookie_samesite_none_insecure', 'cookie')
+    return findings
+
+
+def header_fingerprint(headers: Dict[str, List[str]]) -> Tuple:
+    """판정에 쓰이는 헤더만 모은 지문 (쿠키는 값이 요청마다 달라지므로 이름과 속성만 사용)"""
+    cookies = []
+    for header in headers.get('set-cookie', []):
+        name, attributes = parse_set_cookie(header)
+        cookies.append((name, tuple(sorted(attributes.items()))))
+    return (tuple((name, tuple(headers.get(name, ()))) for name in SECURITY_HEADER_NAMES), tuple(sorted(cookies)))
+
+
+HEADER_MEMO_SIZE = 4096  # 메모이즈할 (출처, 헤더 지문) 수 상한, 넘으면 가장 오래 쓰지 않은 항목부터 제거
+_header_analysis_memo: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+
+
+def analyze_response_headers(url: str, raw_headers: Any) -> List[Dict[str, Any]]:
+    """응답 헤더 판정 (출처 + 헤더 지문 기준으로 메모이즈, 같은 헤더를 쓰는 페이지는 다시 판정하지 않음)"""
+    headers = normalize_response_headers(raw_headers)
+    parts = urlsplit(url)
+    key = (parts.scheme.lower(), parts.netloc.lower(), header_fingerprint(headers))
+    findings = _header_analysis_memo.get(key)
+    if findings is None:
+        findings = analyze_security_headers(url, headers)
+        _header_analysis_memo[key] = findings
+        if len(_header_analysis_memo) > HEADER_MEMO_SIZE:
+            _header_analysis_memo.popitem(last=False)
+    else:
+        _header_analysis_memo.move_to_end(key)
+    return [dict(finding) for finding in findings]
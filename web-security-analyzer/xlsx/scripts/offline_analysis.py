@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 분석 스크립트
+브라우저 없이 저장된 HAR 파일과 DOM 스냅샷을 분석하여 보고서 생성
+
+SKILL.md 의 선언형 취약점 규칙(DEFAULT_RULE_SET)을 그대로 읽어 Python 으로 컴파일하고,
+HTML 을 스트리밍 파서로 한 번만 읽으며 규칙을 평가 (여러 CPU 코어에서 병렬 처리)
+결과는 분석 행 로그(findings_log)를 거쳐 ExcelReportGenerator 로 보고서 생성
+
+입력:
+    *.har             HAR 파일 (text/html 응답 본문을 페이지로 분석, 응답 헤더와 쿠키 속성도 판정)
+    *.json            DOM 스냅샷 ({"url": ..., "html": ...} 또는 그 목록)
+    *.html, *.htm     저장된 HTML (URL 은 파일 경로)
+    디렉토리          위 형식의 파일을 하위 디렉토리까지 검색
+
+사용 예:
+    python offline_analysis.py captures/ --formats xlsx csv --output archive_2024
+    python offline_analysis.py site.har --rules custom_rules.json --processes 8
+"""
+
+import argparse
+import ast
+import base64
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from html.parser import HTMLParser
+from typing import Dict, List, Any, Iterator, Optional
+
+from excel_generator import ExcelReportGenerator
+from findings_export import EXPORT_FORMATS
+from findings_log import FindingsLog
+from header_analysis import analyze_response_headers
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SKILL_PATH = os.path.join(os.path.dirname(SCRIPT_DIR), "SKILL.md")
+
+# 스냅샷 파일 확장자
+HAR_EXTENSIONS = (".har",)
+SNAPSHOT_EXTENSIONS = (".json", ".html", ".htm")
+
+
+def read_skill_literal(name: str, function: Optional[str] = None) -> Any:
+    """SKILL.md 코드 블록에서 상수(리터럴) 값을 읽음 (코드는 실행하지 않음)
+
+    function 을 지정하면 해당 함수 안의 지역 변수에서 찾음
+    """
+    with open(SKILL_PATH, "r", encoding="utf-8") as f:
+        blocks = re.findall(r"```python\n(.*?)```", f.read(), re.S)
+
+    for block in blocks:
+        tree = ast.parse(block)
+        scopes = [tree]
+        if function is not None:
+            scopes = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef) and node.name == function]
+        for scope in scopes:
+            for node in scope.body:
+                if isinstance(node, ast.Assign):
+                    targets = node.targets
+                elif isinstance(node, ast.AnnAssign) and node.value is not None:
+                    targets = [node.target]
+                else:
+                    continue
+                if any(isinstance(target, ast.Name) and target.id == name for target in targets):
+                    return ast.literal_eval(node.value)
+    raise LookupError(f"SKILL.md 에서 {name} 을 찾지 못했습니다")
+
+
+def load_rule_set(path: Optional[str] = None) -> Dict[str, Any]:
+    """규칙 세트 로드 (path 미지정 시 SKILL.md 의 DEFAULT_RULE_SET)"""
+    if path is None:
+        return read_skill_literal("DEFAULT_RULE_SET")
+    with open(path, "r", encoding="utf-8") as f:
+        rule_set = json.load(f)
+    if not rule_set.get("version") or not isinstance(rule_set.get("rules"), list):
+        raise ValueError(f"규칙 파일 형식 오류 (version, rules 필요): {path}")
+    return rule_set
+
+
+# 규칙이 사용하는 CSS 선택자 (태그, .클래스, [속성], [속성="값"], [속성^="값"], [속성*="값"], [속성~="값"], 콤마)
+_SIMPLE_SELECTOR = re.compile(r"^([a-zA-Z][\w-]*|\*)?((?:\.[\w-]+)*)((?:\[[^\]]+\])*)$")
+_ATTRIBUTE_SELECTOR = re.compile(r"\[\s*([\w-]+)\s*(?:([\^*~]?=)\s*\"([^\"]*)\")?\s*\]")
+_ATTRIBUTE_TESTS = {
+    None: lambda value, expected: True,
+    "=": lambda value, expected: value == expected,
+    "^=": lambda value, expected: value.startswith(expected),
+    "*=": lambda value, expected: expected in value,
+    "~=": lambda value, expected: expected in value.split(),
+}
+
+
+def compile_selector(selector: str):
+    """선택자를 (태그, 속성 dict) -> bool 함수로 컴파일"""
+    alternatives = []
+    for part in selector.split(","):
+        match = _SIMPLE_SELECTOR.match(part.strip())
+        if match is None:
+            raise ValueError(f"지원하지 않는 선택자: {selector}")
+        tag = (match.group(1) or "*").lower()
+        classes = [name for name in match.group(2).split(".") if name]
+        # findall 은 연산자가 없으면 빈 문자열을 반환
+        attributes = [(name.lower(), _ATTRIBUTE_TESTS[op or None], expected)
+                      for name, op, expected in _ATTRIBUTE_SELECTOR.findall(match.group(3))]
+        alternatives.append((tag, classes, attributes))
+
+    def matches(tag: str, attrs: Dict[str, str]) -> bool:
+        for selector_tag, classes, attributes in alternatives:
+            if selector_tag != "*" and selector_tag != tag:
+                continue
+            if classes and not set(classes) <= set(attrs.get("class", "").split()):
+                continue
+            if all(name in attrs and test(attrs[name], expected) for name, test, expected in attributes):
+                return True
+        return False
+
+    return matches
+
+
+# 규칙 조건 -> (속성 dict, 페이지 정보) -> bool (SKILL.md RULE_CONDITIONS 와 같은 의미)
+RULE_CONDITIONS = {
+    "missing_attributes": lambda names: lambda attrs, page: all(name not in attrs for name in names),
+    "attribute_equals": lambda spec: lambda attrs, page: all(
+        attrs.get(name, "").lower() == str(value).lower() for name, value in spec.items()),
+    "attribute_not": lambda spec: lambda attrs, page: all(attrs.get(name) != value for name, value in spec.items()),
+    "page_https": lambda expected: lambda attrs, page: page["is_https"] == bool(expected),
+    "form_method_not": lambda method: lambda attrs, page: (
+        page["form_method"] is not None and page["form_method"] != method.lower()),
+}
+
+# DOM 속성 이름 -> HTML 속성 이름 (규칙의 label 은 DOM 속성 이름 사용)
+LABEL_ATTRIBUTES = {"className": "class"}
+
+
+class RuleEngine:
+    """규칙 세트를 태그별 검사 목록으로 컴파일하여 HTML 을 한 번 읽으며 평가"""
+
+    def __init__(self, rule_set: Dict[str, Any], counters: Dict[str, Any]):
+        self.version = str(rule_set["version"])
+        self.checks: List[Dict[str, Any]] = []
+        self.by_tag: Dict[str, List[int]] = {}
+        fields: List[str] = []
+
+        for rule in rule_set["rules"]:
+            if not rule.get("id") or not rule.get("tags") or "finding" not in rule:
+                raise ValueError(f"규칙에 id, tags, finding 이 필요합니다: {rule}")
+            when = dict(rule.get("when", {}))
+            lacks_field = when.pop("lacks_field", None)
+            unknown = set(when) - set(RULE_CONDITIONS)
+            if unknown:
+                raise ValueError(f"규칙 {rule['id']}: 지원하지 않는 조건 {', '.join(sorted(unknown))}")
+
+            field_index = -1
+            if lacks_field is not None:
+                if lacks_field not in fields:
+                    fields.append(lacks_field)
+                    self._add(["input", "select", "textarea", "button"],
+                              {"kind": "field", "selector": lacks_field, "field": len(fields) - 1})
+                field_index = fields.index(lacks_field)
+
+            self._add(rule["tags"], {
+                "kind": "rule",
+                "selector": rule.get("selector"),
+                "tests": [RULE_CONDITIONS[name](value) for name, value in when.items()],
+                "finding": dict(rule["finding"], rule=rule["id"]),
+                "lacks_field": field_index,
+                "aggregate": bool(rule.get("aggregate")),
+                "element": rule.get("element", ""),
+                "label": [LABEL_ATTRIBUTES.get(name, name) for name in rule.get("label", ["id"])],
+                "label_prefix": rule.get("label_prefix", rule["finding"].get("elementType", "element"))
+            })
+
+        for name, (tags, selector) in counters.items():
+            self._add(tags, {"kind": "counter", "name": name, "selector": selector})
+        self.field_count = len(fields)
+
+    def _add(self, tags: List[str], check: Dict[str, Any]):
+        check["match"] = compile_selector(check["selector"]) if check.get("selector") else None
+        for tag in tags:
+            self.by_tag.setdefault(tag.lower(), []).append(len(self.checks))
+        self.checks.append(check)
+
+    def analyze(self, html: str, url: str) -> Dict[str, Any]:
+        """HTML 문서 하나 분석 (SKILL.md 프로브의 vulnerabilities, page_info 와 같은 형식)"""
+        visitor = _RuleVisitor(self, url)
+        visitor.feed(html)
+        visitor.close()
+        return visitor.result()
+
+
+class _RuleVisitor(HTMLParser):
+    """시작 태그마다 해당 태그의 검사만 평가하는 스트리밍 방문자 (DOM 트리를 만들지 않음)"""
+
+    def __init__(self, engine: RuleEngine, url: str):
+        super().__init__(convert_charrefs=True)
+        self.engine = engine
+        # form_method 는 현재 열린 폼의 method (폼 밖이면 None)
+        self.page = {"is_https": url.lower().startswith("https:"), "form_method": None}
+        self.match_counts = [0] * len(engine.checks)
+        self.hits: List[List[Any]] = [[] for _ in engine.checks]
+        self.field_forms = [set() for _ in range(engine.field_count)]
+        self.forms: List[int] = []
+        self.form_methods: List[str] = []
+        self.form_count = 0
+        self.link_count = 0
+        self.title: Optional[List[str]] = None
+        self.title_text = ""
+
+    def handle_starttag(self, tag, attrs):
+        # 값 없는 속성(required 등)은 DOM 의 getAttribute 처럼 빈 문자열
+        attrs = {name: "" if value is None else value for name, value in attrs}
+        node_id = None
+        if tag == "form":
+            node_id = self.form_count
+            self.form_count += 1
+            self.forms.append(node_id)
+            self.form_methods.append((attrs.get("method") or "get").lower())
+            self.page["form_method"] = self.form_methods[-1]
+        elif tag == "a" and "href" in attrs:
+            self.link_count += 1
+        elif tag == "title" and self.title is None:
+            self.title = []
+
+        for index in self.engine.by_tag.get(tag, ()):
+            check = self.engine.checks[index]
+            if check["match"] is not None and not check["match"](tag, attrs):
+                continue
+            match_index = self.match_counts[index]
+            self.match_counts[index] += 1
+            if check["kind"] == "field":
+                if self.forms:
+                    self.field_forms[check["field"]].add(self.forms[-1])
+            elif check["kind"] == "rule" and all(test(attrs, self.page) for test in check["tests"]):
+                self.hits[index].append((node_id, attrs, match_index))
+
+    def handle_endtag(self, tag):
+        if tag == "form" and self.forms:
+            self.forms.pop()
+            self.form_methods.pop()
+            self.page["form_method"] = self.form_methods[-1] if self.form_methods else None
+        elif tag == "title" and self.title is not None and not self.title_text:
+            self.title_text = "".join(self.title).strip()
+
+    def handle_data(self, data):
+        if self.title is not None and not self.title_text:
+            self.title.append(data)
+
+    def result(self) -> Dict[str, Any]:
+        vulnerabilities = []
+        counters = {}
+        for index, check in enumerate(self.engine.checks):
+            if check["kind"] == "counter":
+                counters[check["name"]] = self.match_counts[index]
+            if check["kind"] != "rule":
+                continue
+            hits = self.hits[index]
+            if check["lacks_field"] >= 0:
+                hits = [hit for hit in hits if hit[0] not in self.field_forms[check["lacks_field"]]]
+            if not hits:
+                continue
+            if check["aggregate"]:
+                vulnerabilities.append(dict(check["finding"], element=check["element"].replace("{count}", str(len(hits)))))
+                continue
+            for _, attrs, match_index in hits:
+                label = next((attrs[name] for name in check["label"] if attrs.get(name)), None)
+                vulnerabilities.append(dict(check["finding"], element=label or f"{check['label_prefix']}_{match_index}"))
+
+        return {
+            "vulnerabilities": vulnerabilities,
+            "page_info": {
+                "title": self.title_text,
+                "total_forms": self.form_count,
+                "total_inputs": counters.get("total_inputs", 0),
+                "total_links": self.link_count,
+                "has_password_fields": counters.get("password_fields", 0) > 0
+            }
+        }
+
+
+def iter_har_documents(path: str) -> Iterator[Dict[str, Any]]:
+    """HAR 파일의 HTML 응답을 문서로 변환"""
+    with open(path, "r", encoding="utf-8") as f:
+        har = json.load(f)
+    for entry in har.get("log", {}).get("entries", []):
+        content = entry.get("response", {}).get("content", {})
+        text = content.get("text")
+        if not text or "html" not in content.get("mimeType", ""):
+            continue
+        if content.get("encoding") == "base64":
+            text = base64.b64decode(text).decode("utf-8", errors="replace")
+        yield {"url": entry.get("request", {}).get("url", ""), "html": text, "source": path,
+               "headers": entry.get("response", {}).get("headers", [])}
+
+
+def iter_snapshot_documents(path: str) -> Iterator[Dict[str, Any]]:
+    """DOM 스냅샷 파일을 문서로 변환 (.html 은 작업 프로세스에서 읽도록 경로만 전달)"""
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for snapshot in data if isinstance(data, list) else [data]:
+            if snapshot.get("html"):
+                yield {"url": snapshot.get("url", ""), "html": snapshot["html"], "source": path}
+    else:
+        yield {"url": "file://" + os.path.abspath(path), "path": path, "source": path}
+
+
+def iter_documents(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    """입력 경로(파일/디렉토리)의 모든 분석 대상 문서"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                yield from iter_documents(sorted(os.path.join(root, name) for name in files
+                                                 if name.lower().endswith(HAR_EXTENSIONS + SNAPSHOT_EXTENSIONS)))
+        elif path.lower().endswith(HAR_EXTENSIONS):
+            yield from iter_har_documents(path)
+        elif path.lower().endswith(SNAPSHOT_EXTENSIONS):
+            yield from iter_snapshot_documents(path)
+
+
+_engine: Optional[RuleEngine] = None
+_recommendations: Dict[str, str] = {}
+
+
+def _init_worker(rule_set: Dict[str, Any], counters: Dict[str, Any], recommendations: Dict[str, str]):
+    """작업 프로세스마다 규칙을 한 번만 컴파일"""
+    global _engine, _recommendations
+    _engine = RuleEngine(rule_set, counters)
+    _recommendations = recommendations
+
+
+def analyze_document(document: Dict[str, Any]) -> Dict[str, Any]:
+    """문서 하나 분석 후 메뉴별 상세 분석 행 생성 (SKILL.md page_finding_rows 와 같은 형식)"""
+    url = document.get("url", "")
+    try:
+        html = document.get("html")
+        if html is None:
+            with open(document["path"], "r", encoding="utf-8", errors="replace") as f:
+                html = f.read()
+        analysis = _engine.analyze(html, url)
+        if document.get("headers"):
+            analysis["vulnerabilities"] += analyze_response_headers(url, document["headers"])
+    except Exception as e:
+        analysis = {"vulnerabilities": [], "page_info": {}, "error": str(e)}
+
+    page_info = analysis["page_info"]
+    base = {
+        "메뉴": page_info.get("title") or url.rsplit("/", 1)[-1] or url,
+        "URL": url,
+        "HTTP메소드": "N/A",
+        "인증필요": "Yes" if page_info.get("has_password_fields") else "No"
+    }
+    rows = []
+    for vuln in analysis["vulnerabilities"]:
+        rows.append(dict(base, **{
+            "요소유형": vuln.get("elementType", "unknown"),
+            "요소명": vuln.get("element", ""),
+            "파라미터": f"{vuln.get('elementType', '')}: {vuln.get('element', '')}",
+            "취약점종류": vuln.get("type", "UNKNOWN"),
+            "위험도": vuln.get("severity", "LOW"),
+            "상세설명": vuln.get("description", ""),
+            "패턴": vuln.get("pattern", "unknown"),
+            "권장조치": _recommendations.get(str(vuln.get("type", "")).upper(), "상세한 보안 검토 필요")
+        }))
+    if "error" in analysis:
+        rows.append(dict(base, **{
+            "요소유형": "page", "요소명": "", "파라미터": "offline_analysis", "취약점종류": "분석 실패",
+            "위험도": "LOW", "상세설명": f"분석 오류: {analysis['error']}", "패턴": "analysis_failed",
+            "권장조치": "페이지 재분석 필요"
+        }))
+    elif not rows:
+        rows.append(dict(base, **{
+            "요소유형": "page", "요소명": page_info.get("title", ""),
+            "파라미터": f"페이지 제목: {page_info.get('title', '')}", "취약점종류": "없음", "위험도": "LOW",
+            "상세설명": "특별한 취약점 발견되지 않음", "패턴": "no_vulnerabilities", "권장조치": "정기적인 보안 점검 권장"
+        }))
+    return {"url": url, "source": document.get("source", ""), "rows": rows}
+
+
+def run_offline_analysis(paths: List[str], output_basename: Optional[str] = None, formats=("xlsx",),
+                         processes: Optional[int] = None, rules_path: Optional[str] = None) -> Dict[str, str]:
+    """저장된 HAR/DOM 스냅샷 분석 후 보고서 생성 (형식 -> 파일 경로 반환)
+
+    processes=1 이면 현재 프로세스에서 순서대로 분석 (기본값은 CPU 코어 수)
+    """
+    if output_basename is None:
+        kst = datetime.now() + timedelta(hours=9)
+        output_basename = f"offline_security_analysis_{kst.strftime('%Y%m%d_%H%M%S')}"
+
+    worker_args = (load_rule_set(rules_path), read_skill_literal("PROBE_COUNTERS"),
+                   read_skill_literal("recommendations", function="get_recommendation"))
+    log_path = f"{output_basename}.findings.jsonl"
+    start = time.perf_counter()
+    pages = 0
+
+    with FindingsLog(log_path) as log:
+        if processes == 1:
+            _init_worker(*worker_args)
+            results = map(analyze_document, iter_documents(paths))
+            for page in results:
+                log.append(page["rows"], url=page["url"], source=page["source"])
+                pages += 1
+        else:
+            with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=worker_args) as executor:
+                for page in executor.map(analyze_document, iter_documents(paths), chunksize=32):
+                    log.append(page["rows"], url=page["url"], source=page["source"])
+                    pages += 1
+
+    elapsed = time.perf_counter() - start
+    rate = pages / elapsed * 60 if elapsed > 0 else 0
+    print(f"오프라인 분석 완료: {pages}개 페이지, {elapsed:.2f}초 ({rate:,.0f} 페이지/분)")
+    if not pages:
+        return {}
+
+    generator = ExcelReportGenerator.from_findings_log(log_path)
+    outputs = generator.create_reports(formats, output_basename, streaming=True)
+    outputs["findings_log"] = log_path
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 HAR/DOM 스냅샷 오프라인 보안 분석")
+    parser.add_argument("inputs", nargs="+", help="HAR 파일, DOM 스냅샷(.json/.html) 또는 디렉토리")
+    parser.add_argument("--output", help="출력 파일 이름 (확장자 제외)")
+    parser.add_argument("--formats", nargs="+", default=["xlsx"], choices=("xlsx",) + EXPORT_FORMATS,
+                        help="보고서 형식 (기본값: xlsx)")
+    parser.add_argument("--processes", type=int, help="분석 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--rules", help="규칙 JSON 파일 (기본값: SKILL.md 의 DEFAULT_RULE_SET)")
+    args = parser.parse_args()
+
+    outputs = run_offline_analysis(args.inputs, args.output, args.formats, args.processes, args.rules)
+    for fmt, path in outputs.items():
+        print(f"  {fmt}: {path}")
+
+
+if __name__ == "__main__":
+    main()
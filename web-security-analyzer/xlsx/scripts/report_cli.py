@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보고서 생성 통합 CLI
+분석 결과 파일로 각 보고서 생성기를 실행하는 단일 진입점
+
+pandas/openpyxl/pyarrow 등 import 비용이 큰 모듈은 선택한 명령과 형식이 필요로 할 때만 import
+(csv/jsonl 만 만들면 엑셀 라이브러리를 읽지 않음). --profile-imports 로 import 시간을 확인
+
+명령:
+    detailed  excel_generator (분석 행 JSON 목록, 기존 형식 dict, 분석 행 로그 *.findings.jsonl)
+    original  excel_generator_original (페이지 분석 결과 dict)
+    website   website_security_analysis (입력 생략 시 기본 분석 데이터)
+
+사용 예:
+    python report_cli.py detailed results.json --formats csv jsonl --output findings
+    python report_cli.py detailed web_security_analysis.findings.jsonl --formats xlsx --streaming
+    python report_cli.py detailed web_security_analysis.findings.jsonl --split-by host --split-workbooks
+    python report_cli.py original page_analysis.json --output page_report.xlsx
+    python report_cli.py original page_analysis.json --sheets summary forms storage
+    python report_cli.py original page_analysis.json --processes 4
+    python report_cli.py website --profile-imports
+    python report_cli.py --profile-imports detailed results.json --formats csv
+"""
+
+import argparse
+import builtins
+import json
+import sys
+import time
+from typing import Dict, List, Any, Optional
+
+SCRIPT_START = time.perf_counter()
+
+# detailed 명령이 지원하는 형식 (findings_export.EXPORT_FORMATS 와 같음, 목록만 쓰려고 모듈을 읽지 않음)
+DETAILED_FORMATS = ("xlsx", "csv", "jsonl", "parquet")
+# 상세 시트당 기본 최대 행 수 (excel_generator.DETAIL_SHEET_MAX_ROWS 와 같음)
+DETAIL_SHEET_MAX_ROWS = 100000
+
+
+class ImportProfiler:
+    """실행 중 처음 import 되는 모듈의 소요 시간 기록
+
+    import 문이 중첩되면 가장 바깥 import 만 기록하므로 시간에는 하위 모듈 import 가 포함됨
+    (모듈별 상세 시간은 python -X importtime 사용)
+    """
+
+    def __init__(self):
+        self.timings: List[tuple] = []
+        self.stage = "CLI"
+        self._depth = 0
+        self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if self._depth or level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._depth -= 1
+            self.timings.append((self.stage, name, time.perf_counter() - start))
+
+    def start(self):
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def report(self, total: float, limit: int = 15):
+        """import 시간 요약을 stderr 로 출력"""
+        imported = sum(elapsed for _, _, elapsed in self.timings)
+        out = sys.stderr
+        print("\nimport 프로파일 (처음 import 된 모듈, 하위 모듈 포함 시간)", file=out)
+        for stage, name, elapsed in sorted(self.timings, key=lambda item: item[2], reverse=True)[:limit]:
+            print(f"  {elapsed * 1000:8.1f} ms  {name:<32} [{stage}]", file=out)
+        print(f"  import 합계 {imported * 1000:.1f} ms / 전체 {total * 1000:.1f} ms "
+              f"(인터프리터 시작 제외, 모듈 {len(sys.modules)}개 로드됨)", file=out)
+
+
+def load_input(path: Optional[str]) -> Any:
+    """입력 JSON 파일 읽기 ('-' 는 표준 입력)"""
+    if path is None:
+        return None
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run_detailed(args, profiler: ImportProfiler) -> Dict[str, str]:
+    profiler.stage = "detailed"
+    from excel_generator import ExcelReportGenerator
+
+    if args.input.endswith(".findings.jsonl"):
+        generator = ExcelReportGenerator.from_findings_log(args.input)
+    else:
+        generator = ExcelReportGenerator(load_input(args.input))
+    generator.configure_detail_split(args.max_rows_per_sheet, args.split_by, args.split_workbooks)
+    profiler.stage = "detailed 보고서 생성"
+    return generator.create_reports(args.formats, args.output, streaming=args.streaming, sheets=args.sheets,
+                                    processes=args.processes)
+
+
+def run_original(args, profiler: ImportProfiler) -> Dict[str, str]:
+    profiler.stage = "original"
+    from excel_generator_original import ExcelReportGenerator
+
+    generator = ExcelReportGenerator(load_input(args.input))
+    profiler.stage = "original 보고서 생성"
+    return {"xlsx": generator.create_report(args.output, args.sheets, streaming=args.streaming,
+                                            processes=args.processes)}
+
+
+def run_website(args, profiler: ImportProfiler) -> Dict[str, str]:
+    profiler.stage = "website"
+    from website_security_analysis import create_security_report
+
+    output = args.output or "website_security_analysis.xlsx"
+    profiler.stage = "website 보고서 생성"
+    create_security_report(load_input(args.input), output)
+    return {"xlsx": output}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="웹 보안 분석 보고서 생성")
+    parser.add_argument("--profile-imports", action="store_true",
+                        help="import 소요 시간을 표준 오류로 출력")
+    # 명령 뒤에도 같은 옵션을 받음 (SUPPRESS: 명령 뒤에 없으면 명령 앞의 값을 덮어쓰지 않음)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--profile-imports", action="store_true", default=argparse.SUPPRESS,
+                        help="import 소요 시간을 표준 오류로 출력")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    detailed = commands.add_parser("detailed", parents=[common], help="메뉴별 상세 분석 보고서 (xlsx/csv/jsonl/parquet)")
+    detailed.add_argument("input", help="분석 행 JSON 파일, 기존 형식 JSON 파일 또는 *.findings.jsonl 로그 ('-' 는 표준 입력)")
+    detailed.add_argument("--formats", nargs="+", default=["xlsx"], choices=DETAILED_FORMATS,
+                          help="보고서 형식 (기본값: xlsx)")
+    detailed.add_argument("--output", help="출력 파일 이름 (확장자 제외)")
+    detailed.add_argument("--streaming", action="store_true", help="xlsx 를 write-only 스트리밍 모드로 생성")
+    detailed.add_argument("--sheets", nargs="+", metavar="SHEET",
+                          help="xlsx 에 넣을 시트 키 (기본값: menu_details summary vulnerability_summary)")
+    detailed.add_argument("--processes", type=int, help="xlsx 시트를 나누어 생성할 작업 프로세스 수")
+    detailed.add_argument("--max-rows-per-sheet", type=int, default=DETAIL_SHEET_MAX_ROWS,
+                          help=f"상세 시트당 최대 행 수, 넘으면 시트를 나누고 목차 추가 (기본값: {DETAIL_SHEET_MAX_ROWS})")
+    detailed.add_argument("--split-by", choices=("menu", "host"), help="상세 시트를 메뉴 또는 URL 호스트별로 나눔")
+    detailed.add_argument("--split-workbooks", action="store_true",
+                          help="나뉜 상세 시트를 별도 xlsx 파일로 저장 (보고서에는 파일 링크 목차)")
+    detailed.set_defaults(handler=run_detailed)
+
+    original = commands.add_parser("original", parents=[common], help="페이지 분석 보고서 (excel_generator_original)")
+    original.add_argument("input", help="페이지 분석 결과 JSON 파일 ('-' 는 표준 입력)")
+    original.add_argument("--output", help="출력 xlsx 파일 경로")
+    original.add_argument("--sheets", nargs="+", metavar="SHEET",
+                          help="넣을 시트 키 (기본값: 페이지 분석 시트 9종, excel_generator.SHEET_REGISTRY 참고)")
+    original.add_argument("--streaming", action="store_true", help="write-only 스트리밍 모드로 생성")
+    original.add_argument("--processes", type=int, help="시트를 나누어 생성할 작업 프로세스 수")
+    original.set_defaults(handler=run_original)
+
+    website = commands.add_parser("website", parents=[common], help="웹사이트 보안 분석 보고서 (website_security_analysis)")
+    website.add_argument("input", nargs="?", help="분석 데이터 JSON 파일 (생략 시 기본 분석 데이터)")
+    website.add_argument("--output", help="출력 xlsx 파일 경로")
+    website.set_defaults(handler=run_website)
+
+    args = parser.parse_args()
+
+    profiler = ImportProfiler()
+    if args.profile_imports:
+        profiler.start()
+    try:
+        outputs = args.handler(args, profiler)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        profiler.stop()
+
+    for fmt, path in outputs.items():
+        print(f"  {fmt}: {path}")
+    if args.profile_imports:
+        profiler.report(time.perf_counter() - SCRIPT_START)
+
+
+if __name__ == "__main__":
+    main()
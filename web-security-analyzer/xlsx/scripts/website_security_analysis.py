@@ -5,104 +5,120 @@
 Chrome DevTools로 수집된 데이터를 기반으로 엑셀 보고서 생성
 """
 
-import pandas as pd
-from datetime import datetime, timezone
-import json
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, Optional
 
-def create_security_report():
-    """보안 분석 결과를 엑셀 보고서로 생성"""
+from header_analysis import analyze_response_headers, normalize_response_headers
+
+def create_security_report(analysis_data: Optional[Dict[str, Any]] = None,
+                           output_filename: str = 'website_security_analysis.xlsx'):
+    """보안 분석 결과를 엑셀 보고서로 생성 (analysis_data 미지정 시 기본 분석 데이터 사용)"""
 
     # 분석 데이터
-    analysis_data = {
-        'basic_info': {
-            'target_url': 'https://imgtopdf-web.vercel.app',
-            'analysis_date': datetime.now(timezone('Asia/Seoul')).strftime('%Y-%m-%d %H:%M:%S'),
-            'analyzer': 'Chrome DevTools MCP',
-            'page_title': 'NoKeep - 이미지·PDF 변환 웹 앱'
-        },
-
-        'page_structure': {
-            'main_headings': ['NoKeep', '업로드된 파일 (0/10)', '미리보기', '옵션'],
-            'navigation_tabs': ['이미지', '추출', '병합', '분리', '서명'],
-            'main_features': [
-                '이미지 → PDF 변환',
-                'PDF → 이미지 변환',
-                'PDF 병합',
-                'PDF 분리',
-                '서명/도장 만들기'
-            ],
-            'total_buttons': 34,
-            'file_inputs': 9
-        },
-
-        'security_analysis': {
-            'https_enabled': True,
-            'mixed_content': 0,
-            'csp_header': None,
-            'cookies_found': False,
-            'localStorage_empty': True,
-            'sessionStorage_empty': True
-        },
-
-        'network_analysis': {
-            'total_requests': 10,
-            'successful_requests': 9,
-            'failed_requests': 1,
-            'resource_types': {
-                'document': 1,
-                'script': 7,
-                'stylesheet': 1,
-                'image': 1
+    if analysis_data is None:
+        analysis_data = {
+            'basic_info': {
+                'target_url': 'https://imgtopdf-web.vercel.app',
+                'analysis_date': datetime.now(timezone(timedelta(hours=9))).strftime('%Y-%m-%d %H:%M:%S'),
+                'analyzer': 'Chrome DevTools MCP',
+                'page_title': 'NoKeep - 이미지·PDF 변환 웹 앱'
             },
-            'static_resources': [
-                '/_next/static/css/72d2326c0926b2b5.css',
-                '/_next/static/chunks/webpack-7c05ac82a9e766ff.js',
-                '/_next/static/chunks/4bd1b696-01f7aefb5200712e.js',
-                '/_next/static/chunks/223-2580436733098fe6.js',
-                '/_next/static/chunks/main-app-3d96b844cd9265c5.js',
-                '/_next/static/chunks/app/layout-0b7f257b05210f36.js',
-                '/_next/static/chunks/632-f91c28dba2e5f307.js',
-                '/_next/static/chunks/app/page-14a38f3ab78eebea.js'
-            ]
-        },
 
-        'vulnerability_assessment': {
-            'high_risk': [],
-            'medium_risk': [
-                'CSP(Content Security Policy) 헤더 부재',
-                '클라이언트 측 파일 처리로 인한 잠재적 메모리 누수'
-            ],
-            'low_risk': [
-                'Canvas 성능 경고',
-                '인라인 스크립트 사용'
-            ],
-            'observations': [
-                '모든 파일이 클라이언트 측에서 처리됨',
-                '서버에 파일이 영구 저장되지 않는다는 명시',
-                'HTTPS 전용 통신',
-                'Mixed Content 없음'
-            ]
-        },
-
-        'forms_and_inputs': {
-            'total_forms': 0,
-            'file_inputs': [
-                {'accept': 'image/jpeg,image/png,image/jpg', 'multiple': True, 'count': 2},
-                {'accept': 'application/pdf', 'multiple': True, 'count': 6},
-                {'accept': 'image/*', 'multiple': False, 'count': 1}
-            ]
-        },
+            'page_structure': {
+                'main_headings': ['NoKeep', '업로드된 파일 (0/10)', '미리보기', '옵션'],
+                'navigation_tabs': ['이미지', '추출', '병합', '분리', '서명'],
+                'main_features': [
+                    '이미지 → PDF 변환',
+                    'PDF → 이미지 변환',
+                    'PDF 병합',
+                    'PDF 분리',
+                    '서명/도장 만들기'
+                ],
+                'total_buttons': 34,
+                'file_inputs': 9
+            },
+
+            'security_analysis': {
+                'https_enabled': True,
+                'mixed_content': 0,
+                'csp_header': None,
+                'cookies_found': False,
+                'localStorage_empty': True,
+                'sessionStorage_empty': True
+            },
 
-        'privacy_features': {
-            'client_side_processing': True,
-            'no_server_storage': True,
-            'privacy_policy_mentioned': True,
-            'file_auto_deletion': True
+            'network_analysis': {
+                'total_requests': 10,
+                'successful_requests': 9,
+                'failed_requests': 1,
+                'resource_types': {
+                    'document': 1,
+                    'script': 7,
+                    'stylesheet': 1,
+                    'image': 1
+                },
+                'static_resources': [
+                    '/_next/static/css/72d2326c0926b2b5.css',
+                    '/_next/static/chunks/webpack-7c05ac82a9e766ff.js',
+                    '/_next/static/chunks/4bd1b696-01f7aefb5200712e.js',
+                    '/_next/static/chunks/223-2580436733098fe6.js',
+                    '/_next/static/chunks/main-app-3d96b844cd9265c5.js',
+                    '/_next/static/chunks/app/layout-0b7f257b05210f36.js',
+                    '/_next/static/chunks/632-f91c28dba2e5f307.js',
+                    '/_next/static/chunks/app/page-14a38f3ab78eebea.js'
+                ]
+            },
+
+            'vulnerability_assessment': {
+                'high_risk': [],
+                'medium_risk': [
+                    'CSP(Content Security Policy) 헤더 부재',
+                    '클라이언트 측 파일 처리로 인한 잠재적 메모리 누수'
+                ],
+                'low_risk': [
+                    'Canvas 성능 경고',
+                    '인라인 스크립트 사용'
+                ],
+                'observations': [
+                    '모든 파일이 클라이언트 측에서 처리됨',
+                    '서버에 파일이 영구 저장되지 않는다는 명시',
+                    'HTTPS 전용 통신',
+                    'Mixed Content 없음'
+                ]
+            },
+
+            'forms_and_inputs': {
+                'total_forms': 0,
+                'file_inputs': [
+                    {'accept': 'image/jpeg,image/png,image/jpg', 'multiple': True, 'count': 2},
+                    {'accept': 'application/pdf', 'multiple': True, 'count': 6},
+                    {'accept': 'image/*', 'multiple': False, 'count': 1}
+                ]
+            },
+
+            'privacy_features': {
+                'client_side_processing': True,
+                'no_server_storage': True,
+                'privacy_policy_mentioned': True,
+                'file_auto_deletion': True
+            }
         }
-    }
 
-    # 엑셀 파일 생성
-    with pd.ExcelWriter('website_security_analysis.xlsx', engine='openpyxl') as writer:
+    # 수집한 문서 응답 헤더가 있으면 CSP 설정 여부와 헤더 점검 결과를 헤더에서 판정
+    # (호출 측 dict 는 바꾸지 않고 복사본에 반영하여 반환)
+    security = dict(analysis_data['security_analysis'])
+    analysis_data = dict(analysis_data, security_analysis=security)
+    header_findings = []
+    if security.get('response_headers'):
+        headers = normalize_response_headers(security['response_headers'])
+        security['csp_header'] = (headers.get('content-security-policy') or [None])[0]
+        header_findings = analyze_response_headers(analysis_data['basic_info']['target_url'],
+                                                   security['response_headers'])
+
+    # 엑셀 파일 생성 (pandas 는 import 비용이 커서 보고서를 만들 때 import)
+    import pandas as pd
+
+    with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
 
         # 1. 요약 정보
         summary_data = {
@@ -142,6 +158,14 @@ def create_security_report():
         }
         pd.DataFrame(security_data).to_excel(writer, sheet_name='보안 분석', index=False)
 
+        if header_findings:
+            pd.DataFrame([{
+                '항목': finding['element'],
+                '종류': finding['type'],
+                '위험도': finding['severity'],
+                '설명': finding['description']
+            } for finding in header_findings]).to_excel(writer, sheet_name='응답 헤더 점검', index=False)
+
         # 3. 페이지 구조
         structure_data = {
             '구성 요소': ['메인 헤딩', '내비게이션 탭', '주요 기능', '전체 버튼 수', '파일 입력 필드'],
@@ -221,7 +245,7 @@ def create_security_report():
         }
         pd.DataFrame(privacy_data).to_excel(writer, sheet_name='프라이버시 특징', index=False)
 
-    print("보안 분석 보고서가 생성되었습니다: website_security_analysis.xlsx")
+    print(f"보안 분석 보고서가 생성되었습니다: {output_filename}")
     return analysis_data
 
 if __name__ == "__main__":
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+xlsx 시트 파트 조립
+시트 하나씩 따로 저장한 xlsx 파일(파트)을 하나의 통합 문서로 합침
+
+병렬 렌더링(ExcelReportGenerator.create_report(processes=N))에서 작업 프로세스가 시트별로 저장한
+파트를 조립하는 데 사용. 시트 XML 은 다시 해석하지 않고 그대로 옮기며, 통합 문서 수준의
+작은 파트(workbook.xml, 관계, 콘텐츠 형식)만 새로 작성
+
+파트 조건:
+    - 시트가 하나인 openpyxl 저장 파일 (문자열은 openpyxl 기본값인 인라인 문자열로 기록되어 공유 문자열 없음,
+      sharedStrings.xml 이 있는 파트는 ValueError)
+    - 모든 파트의 styles.xml 이 같음 (excel_generator.register_named_styles 가 셀 서식 번호를 고정)
+    - 시트 관계 파일은 외부 하이퍼링크만 포함 (메모/그림 등 다른 파트를 가리키는 시트는 지원하지 않음)
+"""
+
+import shutil
+import zipfile
+from typing import List
+from xml.etree import ElementTree as ET
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+WORKSHEET_REL_TYPE = DOC_REL_NS + "/worksheet"
+WORKSHEET_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+WORKBOOK_PART = "xl/workbook.xml"
+WORKBOOK_RELS_PART = "xl/_rels/workbook.xml.rels"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+STYLES_PART = "xl/styles.xml"
+SHARED_STRINGS_PART = "xl/sharedStrings.xml"
+
+# 조립 시 새로 작성하거나 시트별로 옮기는 파트 (나머지 파트는 첫 파트에서 그대로 복사)
+REBUILT_PARTS = {WORKBOOK_PART, WORKBOOK_RELS_PART, CONTENT_TYPES_PART}
+
+ET.register_namespace("r", DOC_REL_NS)
+
+
+def _qualified(ns: str, tag: str) -> str:
+    return f"{{{ns}}}{tag}"
+
+
+def _worksheet_part(archive: zipfile.ZipFile, path: str) -> str:
+    """파트의 시트 XML 경로 (시트가 하나가 아니면 ValueError)"""
+    rels = ET.fromstring(archive.read(WORKBOOK_RELS_PART))
+    targets = [rel.get("Target") for rel in rels if rel.get("Type") == WORKSHEET_REL_TYPE]
+    if len(targets) != 1:
+        raise ValueError(f"시트가 하나인 파트만 조립 가능: {path} (시트 {len(targets)}개)")
+    target = targets[0]
+    return target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+
+
+def _write_xml(archive: zipfile.ZipFile, name: str, root: ET.Element, namespace: str):
+    """XML 파트 기록 (openpyxl 저장 형식과 같게 문서의 네임스페이스를 접두사 없는 기본 네임스페이스로 기록)
+
+    ElementTree 의 기본 네임스페이스 등록은 하나만 유지되므로 파트를 기록할 때마다 다시 등록
+    (default_namespace 인자는 접두사 없는 속성이 있으면 사용할 수 없음)
+    """
+    ET.register_namespace("", namespace)
+    archive.writestr(name, ET.tostring(root, encoding="utf-8", xml_declaration=True))
+
+
+def _copy_part(source: zipfile.ZipFile, name: str, target: zipfile.ZipFile, target_name: str):
+    """파트 복사 (큰 시트 XML 도 메모리에 올리지 않고 스트림으로 복사)"""
+    with source.open(name) as src, target.open(target_name, "w", force_zip64=True) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def assemble_workbook(part_paths: List[str], output_filename: str) -> str:
+    """시트 파트를 순서대로 합쳐 하나의 xlsx 로 저장
+
+    시트 순서는 part_paths 순서, 시트별 정의된 이름(자동 필터 범위 등)은 새 시트 위치로 옮김
+    """
+    if not part_paths:
+        raise ValueError("조립할 시트 파트가 없음")
+
+    parts = [zipfile.ZipFile(path) for path in part_paths]
+    try:
+        # 공유 문자열은 파트마다 번호가 따로 매겨지므로 시트 XML 을 그대로 옮기면 다른 문자열을 가리킴
+        for path, part in zip(part_paths, parts):
+            if SHARED_STRINGS_PART in part.namelist():
+                raise ValueError(f"공유 문자열(sharedStrings.xml)이 있는 시트 파트는 조립할 수 없음: {path} "
+                                 "(인라인 문자열로 저장하는 openpyxl 저장 파일만 지원)")
+
+        base = parts[0]
+        styles = base.read(STYLES_PART)
+        for path, part in zip(part_paths[1:], parts[1:]):
+            if part.read(STYLES_PART) != styles:
+                raise ValueError(f"스타일 정의가 다른 시트 파트: {path}")
+
+        workbook = ET.fromstring(base.read(WORKBOOK_PART))
+        sheets_el = workbook.find(_qualified(MAIN_NS, "sheets"))
+        names_el = workbook.find(_qualified(MAIN_NS, "definedNames"))
+        if names_el is None:
+            names_el = ET.Element(_qualified(MAIN_NS, "definedNames"))
+            workbook.insert(list(workbook).index(sheets_el) + 1, names_el)
+        for child in list(sheets_el):
+            sheets_el.remove(child)
+        for child in list(names_el):
+            names_el.remove(child)
+
+        with zipfile.ZipFile(output_filename, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as out:
+            worksheet_parts = []
+            for idx, (path, part) in enumerate(zip(part_paths, parts)):
+                source = _worksheet_part(part, path)
+                target = f"xl/worksheets/sheet{idx + 1}.xml"
+                _copy_part(part, source, out, target)
+                worksheet_parts.append(target)
+
+                folder, _, filename = source.rpartition("/")
+                source_rels = f"{folder}/_rels/{filename}.rels"
+                if source_rels in part.namelist():
+                    rels = ET.fromstring(part.read(source_rels))
+                    if any(rel.get("TargetMode") != "External" for rel in rels):
+                        raise ValueError(f"외부 링크 외의 시트 관계는 조립할 수 없음: {path}")
+                    out.writestr(f"xl/worksheets/_rels/sheet{idx + 1}.xml.rels", part.read(source_rels))
+
+                # 시트 이름과 시트별 정의된 이름 (localSheetId 를 새 위치로 변경)
+                part_workbook = ET.fromstring(part.read(WORKBOOK_PART))
+                sheet = part_workbook.find(_qualified(MAIN_NS, "sheets"))[0]
+                sheet.set("sheetId", str(idx + 1))
+                sheet.set(_qualified(DOC_REL_NS, "id"), f"rId{idx + 1}")
+                sheets_el.append(sheet)
+                part_names = part_workbook.find(_qualified(MAIN_NS, "definedNames"))
+                for name in (part_names if part_names is not None else []):
+                    if name.get("localSheetId") is not None:
+                        name.set("localSheetId", str(idx))
+                    names_el.append(name)
+
+            if not len(names_el):
+                workbook.remove(names_el)
+            _write_xml(out, WORKBOOK_PART, workbook, MAIN_NS)
+
+            # 통합 문서 관계 (시트 rId1..N, 나머지 관계는 뒤 번호로 이동)
+            base_rels = ET.fromstring(base.read(WORKBOOK_RELS_PART))
+            rels = ET.Element(_qualified(PKG_REL_NS, "Relationships"))
+            for idx, target in enumerate(worksheet_parts, 1):
+                ET.SubElement(rels, _qualified(PKG_REL_NS, "Relationship"),
+                              {"Type": WORKSHEET_REL_TYPE, "Target": f"/{target}", "Id": f"rId{idx}"})
+            others = [rel for rel in base_rels if rel.get("Type") != WORKSHEET_REL_TYPE]
+            for idx, rel in enumerate(others, len(worksheet_parts) + 1):
+                rel.set("Id", f"rId{idx}")
+                rels.append(rel)
+            _write_xml(out, WORKBOOK_RELS_PART, rels, PKG_REL_NS)
+
+            # 콘텐츠 형식 (시트 Override 만 교체)
+            types = ET.fromstring(base.read(CONTENT_TYPES_PART))
+            for override in list(types):
+                if override.get("ContentType") == WORKSHEET_CONTENT_TYPE:
+                    types.remove(override)
+            for target in worksheet_parts:
+                ET.SubElement(types, _qualified(CONTENT_TYPES_NS, "Override"),
+                              {"PartName": f"/{target}", "ContentType": WORKSHEET_CONTENT_TYPE})
+            _write_xml(out, CONTENT_TYPES_PART, types, CONTENT_TYPES_NS)
+
+            # 나머지 공용 파트 (스타일, 테마, 문서 속성)
+            base_sheet = _worksheet_part(base, part_paths[0])
+            for name in base.namelist():
+                if name in REBUILT_PARTS or name == base_sheet or name.startswith("xl/worksheets/"):
+                    continue
+                out.writestr(name, base.read(name))
+    finally:
+        for part in parts:
+            part.close()
+
+    return output_filename
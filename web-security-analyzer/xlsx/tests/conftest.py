@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""SKILL.md 코드 블록 로더 (스킬 코드는 문서의 python 블록을 한 네임스페이스에서 차례로 실행하여 사용)"""
+
+import os
+import re
+
+import pytest
+
+SKILL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "SKILL.md")
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+
+
+def load_skill(blocks=None):
+    """SKILL.md 의 python 블록(blocks 가 None 이면 전부)을 새 네임스페이스에 실행"""
+    with open(SKILL_PATH, encoding="utf-8") as f:
+        sources = re.findall(r"```python\n(.*?)```", f.read(), re.S)
+    namespace = {}
+    for index in range(len(sources)) if blocks is None else blocks:
+        exec(compile(sources[index], f"{SKILL_PATH}#{index}", "exec"), namespace)
+        # 설정 블록 다음 블록부터 scripts 모듈을 import 하므로 블록마다 설정을 덮어씀
+        namespace['ANALYSIS_CONFIG'].update(retry_backoff=0, retry_backoff_max=0, cache_path=None,
+                                            scripts_dir=SCRIPTS_DIR)
+    return namespace
+
+
+@pytest.fixture
+def skill():
+    """설정/재시도/MCP 래퍼 블록 (테스트마다 새로 실행하여 서킷 상태 초기화)"""
+    return load_skill([0])
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""일괄 분석이 MCP 연결 하나에서 사이트마다 자기 탭으로 분석하는지 가짜 MCP 서버로 확인"""
+
+import asyncio
+import json
+import re
+from urllib.parse import urlsplit
+
+import pytest
+
+from conftest import load_skill
+
+# 사이트별 페이지와 하위 링크
+SITE_LINKS = {
+    "http://a.test/": ["http://a.test/a1", "http://a.test/a2"],
+    "http://a.test/a1": ["http://a.test/a3"],
+    "http://b.test/": ["http://b.test/b1"],
+}
+
+SAFE_HEADERS = {"Content-Security-Policy": "default-src 'self'", "X-Frame-Options": "DENY",
+                "X-Content-Type-Options": "nosniff", "Referrer-Policy": "no-referrer"}
+
+
+class FakeMcpServer:
+    """선택된 탭 하나에만 명령을 보내는 MCP 서버 흉내 (탭 목록 = 각 탭의 현재 URL)"""
+
+    def __init__(self):
+        self.tabs = ["about:blank"]
+        self.selected = 0
+        self.probed = []
+        self.conditional = []
+        self.version = "test"
+
+    def install(self, namespace):
+        for name in ("new_page", "select_page", "navigate_page", "close_page", "evaluate_script",
+                     "list_network_requests", "get_network_request"):
+            namespace[f"mcp__playwright__{name}"] = getattr(self, name)
+
+    async def new_page(self, url):
+        await asyncio.sleep(0)
+        self.tabs.append(url)
+        self.selected = len(self.tabs) - 1
+
+    async def select_page(self, pageIdx):
+        assert 0 <= pageIdx < len(self.tabs)
+        self.selected = pageIdx
+
+    async def navigate_page(self, url):
+        await asyncio.sleep(0.001)
+        self.tabs[self.selected] = url
+
+    async def close_page(self, pageIdx):
+        del self.tabs[pageIdx]
+        self.selected = 0
+
+    async def evaluate_script(self, function, args=()):
+        await asyncio.sleep(0.001)
+        url = self.tabs[self.selected]
+        if "If-None-Match" in function:
+            # 조건부 요청: 탭과 같은 출처면 ETag(= URL)가 같을 때 304, 다른 출처면 스크립트가 요청하지 않음
+            target = json.loads(re.search(r"const url = (.*);", function).group(1))
+            if urlsplit(target)[:2] != urlsplit(url)[:2]:
+                return {"status": 0}
+            self.conditional.append((url, target))
+            return {"status": 304 if json.dumps(json.dumps(target)) in function else 200}
+        if "contentHash" not in function:
+            return url
+        self.probed.append(url)
+        # 페이지 지문은 URL, 프로브에 전달된 이전 지문과 같으면 변경 없음
+        return {"contentHash": url, "version": self.version, "unchanged": json.dumps(url) in function,
+                "page_info": {"title": url},
+                "vulnerabilities": [{"type": "XSS", "severity": "HIGH", "element": "q", "description": url}],
+                "links": [{"url": link, "text": link} for link in SITE_LINKS.get(url, [])]}
+
+    async def list_network_requests(self, resourceTypes=None):
+        return [] if self.tabs[self.selected] == "about:blank" else [{"reqid": self.selected}]
+
+    async def get_network_request(self, reqid):
+        url = self.tabs[reqid]
+        # 헤더 판정에서 발견이 없는 응답 (ETag 는 URL)
+        return {"url": url, "responseHeaders": {"ETag": json.dumps(url), **SAFE_HEADERS}}
+
+
+def test_batch_sites_share_one_connection(tmp_path):
+    skill = load_skill()
+    skill['ANALYSIS_CONFIG'].update(concurrency=2, per_host_rate=0)
+    server = FakeMcpServer()
+    server.install(skill)
+
+    targets = [{'target_url': "http://a.test/"}, {'target_url': "http://b.test/"}]
+    result = asyncio.run(skill['run_batch_security_analysis'](targets, output_dir=str(tmp_path), concurrency=2))
+
+    assert result['failed_sites'] == 0
+    pages = {site['target_url']: site['summary']['total_pages'] for site in result['sites']}
+    assert pages == {"http://a.test/": 4, "http://b.test/": 2}
+    # 프로브는 항상 분석할 페이지가 열린 탭에서 실행되고, 끝난 사이트의 탭은 모두 닫힘
+    assert sorted(server.probed) == sorted(["http://a.test/", "http://a.test/a1", "http://a.test/a2",
+                                            "http://a.test/a3", "http://b.test/", "http://b.test/b1"])
+    assert server.tabs == ["about:blank"]
+
+
+def test_incremental_run_reuses_previous_rows(tmp_path):
+    """두 번째 실행은 이전 실행의 분석 행 로그에서 변경 없는 페이지의 행을 가져옴 (같은 프로세스에서 연속 실행)"""
+    skill = load_skill()
+    skill['ANALYSIS_CONFIG'].update(concurrency=2, per_host_rate=0)
+    server = FakeMcpServer()
+    server.version = skill['page_probe_version']()
+    server.install(skill)
+
+    run = skill['run_web_security_analysis']
+    first = asyncio.run(run("http://a.test/", output_prefix=str(tmp_path / "first")))
+    second = asyncio.run(run("http://a.test/", output_prefix=str(tmp_path / "second"),
+                             previous_results=first['results_file']))
+
+    assert first['summary']['total_pages'] == second['summary']['total_pages'] == 4
+    assert second['carried_over_pages'] == 4
+    assert second['total_vulnerabilities_found'] == first['total_vulnerabilities_found'] == 4
+    # 결과는 보고서 행 없이 증분 분석 상태만 보관
+    assert all('vulnerabilities_found' not in page for page in second['analysis_results'])
+    with open(second['results_file'], encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert sorted(record['rows'][0]['상세설명'] for record in records) == \
+        ["http://a.test/", "http://a.test/a1", "http://a.test/a2", "http://a.test/a3"]
+
+
+def test_read_batch_targets(tmp_path):
+    skill = load_skill()
+    path = tmp_path / "targets.txt"
+    path.write_text("# 대상\nhttp://a.test/\n\nhttp://b.test/ admin secret\n", encoding="utf-8")
+    assert skill['read_batch_targets'](str(path)) == [
+        {'target_url': "http://a.test/", 'username': None, 'password': None},
+        {'target_url': "http://b.test/", 'username': "admin", 'password': "secret"}]
+
+    # 비밀번호 없는 사용자명과 남는 필드는 줄 번호와 함께 거부
+    for line, message in (("http://c.test/ admin", "비밀번호"), ("http://c.test/ admin secret extra", "필드")):
+        path.write_text(f"http://a.test/\n{line}\n", encoding="utf-8")
+        with pytest.raises(ValueError, match=f":2: .*{message}"):
+            skill['read_batch_targets'](str(path))
+
+
+def test_unchanged_pages_skip_analysis(tmp_path):
+    """이전 문서 응답의 ETag 로 304 가 확인된 페이지는 탐색과 분석 없이 이전 결과를 재사용"""
+    skill = load_skill()
+    skill['ANALYSIS_CONFIG'].update(concurrency=1, per_host_rate=0)
+    server = FakeMcpServer()
+    server.version = skill['page_probe_version']()
+    server.install(skill)
+
+    run = skill['run_web_security_analysis']
+    first = asyncio.run(run("http://a.test/", output_prefix=str(tmp_path / "first")))
+    analyze = skill['analyze_page_security']
+    analyzed = []
+
+    async def counting_analyze(url, *args, **kwargs):
+        analyzed.append(url)
+        return await analyze(url, *args, **kwargs)
+
+    skill['analyze_page_security'] = counting_analyze
+    server.probed.clear()
+    second = asyncio.run(run("http://a.test/", output_prefix=str(tmp_path / "second"),
+                             previous_results=first['results_file']))
+
+    assert second['carried_over_pages'] == 4
+    assert analyzed == [] and server.probed == []
+    # 조건부 요청은 대상과 같은 출처를 연 탭에서만 보냄
+    assert sorted(target for _, target in server.conditional) == \
+        ["http://a.test/", "http://a.test/a1", "http://a.test/a2", "http://a.test/a3"]
+    assert all(tab.startswith("http://a.test/") for tab, _ in server.conditional)
+
+
+def test_unchanged_check_needs_same_origin_tab():
+    """about:blank 이나 다른 출처의 탭에서는 조건부 요청을 보내지 않음"""
+    skill = load_skill([0, 1])
+    previous = {'probe_version': skill['page_probe_version'](), 'validators': {'etag': '"v1"'}}
+
+    class Tab:
+        def __init__(self, url):
+            self.url = url
+            self.scripts = []
+
+        async def evaluate(self, script, *args):
+            self.scripts.append(script)
+            return {'status': 304}
+
+    for url in ("about:blank", "http://b.test/x"):
+        tab = Tab(url)
+        assert not asyncio.run(skill['is_unchanged']("http://a.test/", previous, page=tab))
+        assert tab.scripts == []
+    assert asyncio.run(skill['is_unchanged']("http://a.test/", previous, page=Tab("http://a.test/a1")))
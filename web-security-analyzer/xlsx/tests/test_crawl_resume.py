@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""기록 중 강제 종료된 분석을 재개하면 잘린 마지막 줄을 지우고 이어서 기록하는지 확인"""
+
+import asyncio
+
+import pytest
+
+from conftest import load_skill
+from test_batch_analysis import FakeMcpServer
+
+
+class Killed(BaseException):
+    """프로세스 강제 종료 흉내 (분석 코드의 except Exception 에 잡히지 않음)"""
+
+
+class KilledMcpServer(FakeMcpServer):
+    """프로브를 limit 번 실행한 뒤 종료되는 MCP 서버"""
+
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+
+    async def evaluate_script(self, function, args=()):
+        if "contentHash" in function and len(self.probed) >= self.limit:
+            raise Killed()
+        return await super().evaluate_script(function, args)
+
+
+def _run(server, prefix, resume):
+    # 실행마다 새 프로세스처럼 스킬 코드를 새로 실행 (MCP 연결과 서킷 상태를 이어받지 않음)
+    skill = load_skill()
+    skill['ANALYSIS_CONFIG'].update(concurrency=1, per_host_rate=0)
+    server.install(skill)
+    return asyncio.run(skill['run_web_security_analysis']("http://a.test/", output_prefix=prefix, resume=resume))
+
+
+def _kill_mid_write(*paths):
+    # 강제 종료 시 마지막 기록이 줄 중간에서 끊긴 상태
+    for path in paths:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "done", "index": 9, "resu')
+
+
+def test_resume_after_kill_mid_write(tmp_path):
+    prefix = str(tmp_path / "site")
+    checkpoint, findings = f"{prefix}.checkpoint.jsonl", f"{prefix}.findings.jsonl"
+
+    with pytest.raises(Killed):
+        _run(KilledMcpServer(limit=2), prefix, resume=False)
+    _kill_mid_write(checkpoint, findings)
+
+    # 재개 후 다시 종료되어도 재개 중 기록한 완료 페이지가 체크포인트에서 복원됨
+    with pytest.raises(Killed):
+        _run(KilledMcpServer(limit=1), prefix, resume=True)
+    assert len(load_skill([0, 1])['CrawlCheckpoint'].load(checkpoint)['completed']) == 3
+    _kill_mid_write(checkpoint, findings)
+
+    result = _run(FakeMcpServer(), prefix, resume=True)
+    assert result['summary']['total_pages'] == 4
+    assert result['total_vulnerabilities_found'] == 4
+
+
+def test_append_continues_after_last_index(tmp_path):
+    """이어서 기록하는 로그는 기존 최대 index 다음 번호를 사용하여 읽을 때 중복으로 제외되지 않음"""
+    skill = load_skill([0, 1])
+    path = str(tmp_path / "offline.findings.jsonl")
+    with skill['FindingsLog'](path) as log:
+        log.append([{"URL": "a"}], url="a")
+        log.append([{"URL": "b"}], url="b")
+    _kill_mid_write(path)
+    with skill['FindingsLog'](path, append=True) as log:
+        log.append([{"URL": "c"}], url="c")
+
+    records = list(skill['iter_log_records'](path))
+    assert [(record["index"], record["url"]) for record in records] == [(0, "a"), (1, "b"), (2, "c")]
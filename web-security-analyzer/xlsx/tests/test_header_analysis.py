@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""응답 헤더 판정을 스킬과 스크립트가 같은 모듈로 공유하고, 메모가 상한을 넘지 않는지 확인"""
+
+import os
+import sys
+
+from conftest import load_skill
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import header_analysis  # noqa: E402
+
+
+def test_skill_uses_script_module():
+    assert load_skill([0, 1])['analyze_response_headers'] is header_analysis.analyze_response_headers
+
+
+def test_memo_is_bounded(monkeypatch):
+    monkeypatch.setattr(header_analysis, "HEADER_MEMO_SIZE", 3)
+    monkeypatch.setattr(header_analysis, "_header_analysis_memo", header_analysis.OrderedDict())
+    headers = [{"name": "X-Content-Type-Options", "value": "nosniff"}]
+
+    for host in ("a", "b", "c"):
+        header_analysis.analyze_response_headers(f"https://{host}.test/", headers)
+    # 최근에 쓴 출처는 남고 가장 오래 쓰지 않은 출처부터 제거
+    header_analysis.analyze_response_headers("https://a.test/x", headers)
+    findings = header_analysis.analyze_response_headers("https://d.test/", headers)
+
+    assert [key[1] for key in header_analysis._header_analysis_memo] == ["c.test", "a.test", "d.test"]
+    assert {finding["pattern"] for finding in findings} >= {"missing_csp", "missing_hsts"}
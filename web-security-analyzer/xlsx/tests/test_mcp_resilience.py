@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""MCP 호출 계층(재시도, 서킷 브레이커, 페이지 예산, 탭 lock)을 가짜 드라이버로 확인"""
+
+import asyncio
+
+
+class FakeDriver:
+    """MCP 드라이버처럼 모든 탭이 lock 하나를 공유하는 가짜 드라이버"""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.calls = []
+
+
+class FakePage:
+    """navigate 가 failures 번 실패한 뒤 성공하고, delay 초 동안 lock 을 잡는 가짜 탭"""
+
+    def __init__(self, driver: FakeDriver, failures: int = 0, delay: float = 0.0):
+        self.driver = driver
+        self.failures = failures
+        self.delay = delay
+
+    @property
+    def lock(self):
+        return self.driver.lock
+
+    async def navigate(self, url: str):
+        assert self.lock.locked()
+        self.driver.calls.append(url)
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("fake failure")
+
+
+def test_retry_until_success(skill):
+    page = FakePage(FakeDriver(), failures=2)
+    assert asyncio.run(skill['playwright_navigate']("http://retry.test/", page=page))
+    assert len(page.driver.calls) == 3
+
+
+def test_circuit_breaker_opens(skill):
+    threshold = skill['ANALYSIS_CONFIG']['breaker_threshold']
+    page = FakePage(FakeDriver(), failures=100)
+
+    assert not asyncio.run(skill['playwright_navigate']("http://down.test/", page=page, retries=threshold))
+    assert len(page.driver.calls) == threshold
+
+    # 서킷이 열린 동안에는 탭을 호출하지 않음
+    assert not asyncio.run(skill['playwright_navigate']("http://down.test/a", page=page))
+    assert len(page.driver.calls) == threshold
+    # 다른 호스트는 영향 없음
+    assert asyncio.run(skill['playwright_navigate']("http://up.test/", page=FakePage(FakeDriver())))
+
+
+def test_page_budget_stops_retries(skill):
+    page = FakePage(FakeDriver(), failures=100, delay=0.05)
+
+    async def run():
+        with skill['page_budget'](0.12):
+            return await skill['playwright_navigate']("http://slow.test/", page=page, retries=10)
+
+    assert not asyncio.run(run())
+    assert len(page.driver.calls) < 5
+
+
+def test_timeout_starts_after_lock(skill):
+    """다른 탭이 lock 을 잡고 있던 시간은 호출 제한 시간에 포함하지 않음"""
+    skill['ANALYSIS_CONFIG']['timeout'] = 0.2
+    driver = FakeDriver()
+    busy, waiting = FakePage(driver, delay=0.15), FakePage(driver, delay=0.15)
+
+    async def run():
+        return await asyncio.gather(
+            skill['playwright_navigate']("http://a.test/", page=busy, retries=0),
+            skill['playwright_navigate']("http://b.test/", page=waiting, retries=0))
+
+    assert asyncio.run(run()) == [True, True]
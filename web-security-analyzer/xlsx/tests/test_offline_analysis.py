@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""오프라인 분석이 SKILL.md 의 기본 규칙 세트를 그대로 컴파일하고 같은 판정을 내리는지 확인"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from html.parser import HTMLParser
+
+import pytest
+
+from conftest import load_skill
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import offline_analysis  # noqa: E402
+from findings_log import iter_log_records  # noqa: E402
+
+PASSWORD_FORMS = """<html><head><title>login</title></head><body>
+<form id="get-login"><input type="password" name="pw1" autocomplete="off"></form>
+<form id="post-login" method="POST"><input type="password" name="pw2" autocomplete="off">
+<input type="hidden" name="csrf_token"></form>
+<input type="password" name="pw3" autocomplete="off">
+</body></html>"""
+
+
+def test_default_rule_set_compiles():
+    """기본 규칙 세트의 모든 선택자와 조건을 오프라인 엔진이 지원"""
+    engine = offline_analysis.RuleEngine(offline_analysis.load_rule_set(),
+                                         offline_analysis.read_skill_literal("PROBE_COUNTERS"))
+    rules = {check["finding"]["rule"] for check in engine.checks if check["kind"] == "rule"}
+    assert "password_get_method" in rules
+
+    result = engine.analyze(PASSWORD_FORMS, "https://login.test/")
+    # method 가 없는 폼(GET)의 비밀번호만 발견, POST 폼과 폼 밖의 비밀번호는 해당 없음
+    assert [(v["rule"], v["element"]) for v in result["vulnerabilities"]] == [("password_get_method", "pw1")]
+
+
+# 모든 기본 규칙이 한 번 이상 발견되는 문서 (규칙을 추가하면 여기에도 해당 마크업을 추가)
+HAR_PAGE = """<html><head><title>shop</title></head><body>
+<form id="search"><input type="text" name="q"><input type="password" name="pin" autocomplete="off"></form>
+<form class="order" method="post"><textarea name="memo" maxlength="100"></textarea>
+<input type="file" name="receipt"></form>
+<form id="profile" method="post"><input type="hidden" name="_token"><input type="password" id="pw">
+<input type="file" name="photo" accept="image/*"></form>
+<a href="http://a.test/">a</a><a href="http://b.test/">b</a><a href="/c">c</a>
+</body></html>"""
+
+SNAPSHOT_PAGE = """<html><head><title>plain</title></head><body>
+<input type="search"><input type="text" pattern="[0-9]+" name="zip"><a href="http://a.test/">a</a>
+</body></html>"""
+
+# 닫는 태그가 없는 요소
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+# 라이브 프로브의 규칙 평가 구간을 실행하는 최소 DOM (선택자 일치 여부는 Python 에서 미리 계산하여 전달)
+PROBE_HARNESS = """
+const data = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+const NodeFilter = {SHOW_ELEMENT: 1};
+const nodes = data.nodes.map(d => ({
+    tagName: d.tag.toUpperCase(), id: d.attrs.id || '', className: d.attrs['class'] || '', name: d.attrs.name,
+    getAttribute(name) { return name in d.attrs ? d.attrs[name] : null; },
+    hasAttribute(name) { return name in d.attrs; },
+    matches(selector) {
+        if (!(selector in d.matches)) throw new Error('selector not precomputed: ' + selector);
+        return d.matches[selector];
+    },
+    closest(selector) {
+        if (selector !== 'form') throw new Error('unsupported closest: ' + selector);
+        for (let node = this; node; node = node.parent) if (node.tagName === 'FORM') return node;
+        return null;
+    }
+}));
+data.nodes.forEach((d, i) => { nodes[i].parent = d.parent < 0 ? null : nodes[d.parent]; });
+const document = {
+    documentElement: nodes[0],
+    createTreeWalker: () => ({
+        index: 0, currentNode: nodes[0],
+        nextNode() { this.currentNode = nodes[++this.index] || null; return this.currentNode; }
+    })
+};
+const isHTTPS = data.isHTTPS;
+const formElements = nodes.filter(node => node.tagName === 'FORM');
+const probe = {forms: formElements.map(() => ({potentialVulnerabilities: [], csrfToken: '없음'}))};
+__RULE_SECTION__
+process.stdout.write(JSON.stringify(vulnerabilities));
+"""
+
+
+class _TreeBuilder(HTMLParser):
+    """문서 순서(전위 순회)의 요소 목록 (tag, attrs, parent)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.nodes = []
+        self.stack = []
+
+    def handle_starttag(self, tag, attrs):
+        self.nodes.append({"tag": tag, "attrs": {name: value or "" for name, value in attrs},
+                           "parent": self.stack[-1] if self.stack else -1})
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(len(self.nodes) - 1)
+
+    def handle_endtag(self, tag):
+        if self.stack and self.nodes[self.stack[-1]]["tag"] == tag:
+            self.stack.pop()
+
+
+def live_probe_findings(skill, html, url):
+    """SKILL.md 프로브의 규칙 평가 구간을 node 에서 실행한 발견 목록"""
+    script = skill['build_page_probe_script']()
+    start = script.index("    const engine = ")
+    section = script[start:script.index("    probe.vulnerabilities = vulnerabilities;")]
+
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    selectors = {rule["selector"] for rule in skill['DEFAULT_RULE_SET']["rules"] if rule.get("selector")}
+    selectors |= {rule["when"]["lacks_field"] for rule in skill['DEFAULT_RULE_SET']["rules"]
+                  if "lacks_field" in rule.get("when", {})}
+    selectors |= {selector for _, selector in skill['PROBE_COUNTERS'].values()}
+    for node in builder.nodes:
+        node["matches"] = {selector: offline_analysis.compile_selector(selector)(node["tag"], node["attrs"])
+                           for selector in selectors}
+
+    data = {"nodes": builder.nodes, "isHTTPS": url.startswith("https:")}
+    completed = subprocess.run(["node", "-e", PROBE_HARNESS.replace("__RULE_SECTION__", section)],
+                               input=json.dumps(data), capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node 가 필요합니다")
+def test_offline_matches_live_probe(tmp_path, monkeypatch):
+    """HAR + DOM 스냅샷 오프라인 분석 결과가 같은 마크업에 대한 라이브 프로브 규칙 결과와 같음"""
+    har_url, snapshot_url = "https://shop.test/", "http://plain.test/"
+    har = {"log": {"entries": [{"request": {"url": har_url}, "response": {
+        "headers": [], "content": {"mimeType": "text/html", "text": HAR_PAGE}}}]}}
+    (tmp_path / "site.har").write_text(json.dumps(har), encoding="utf-8")
+    (tmp_path / "snapshot.json").write_text(json.dumps({"url": snapshot_url, "html": SNAPSHOT_PAGE}),
+                                            encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    outputs = offline_analysis.run_offline_analysis(["site.har", "snapshot.json"], "offline", formats=("csv",),
+                                                    processes=1)
+    offline = {record["url"]: sorted((row["취약점종류"], row["요소명"], row["패턴"]) for row in record["rows"]
+                                     if row["패턴"] != "no_vulnerabilities")
+               for record in iter_log_records(outputs["findings_log"])}
+
+    skill = load_skill([0, 1])
+    live, rules = {}, set()
+    for url, html in ((har_url, HAR_PAGE), (snapshot_url, SNAPSHOT_PAGE)):
+        findings = live_probe_findings(skill, html, url)
+        rules |= {finding["rule"] for finding in findings}
+        live[url] = sorted((finding["type"], finding["element"], finding["pattern"]) for finding in findings)
+
+    assert offline == live
+    # 기본 규칙이 모두 비교에 포함되어야 새 규칙의 오프라인 미지원이 드러남
+    assert rules == {rule["id"] for rule in skill['DEFAULT_RULE_SET']["rules"]}
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""병렬 렌더링(processes=N) 결과가 단일 프로세스 결과와 같은지 확인"""
+
+import os
+import re
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from benchmark_report import generate_findings  # noqa: E402
+from excel_generator import ExcelReportGenerator  # noqa: E402
+from xlsx_parts import assemble_workbook  # noqa: E402
+
+# 요약 시트의 분석 시간과 문서 속성의 생성 시각은 실행 시점에 따라 달라지므로 비교에서 제외
+TIMESTAMP = re.compile(rb"\d{4}-\d\d-\d\d[ T]\d\d:\d\d:\d\d")
+
+
+def _parts(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: TIMESTAMP.sub(b"T", archive.read(name)) for name in archive.namelist()
+                if name.startswith("xl/")}
+
+
+def _render(tmp_path, name, processes, streaming, **split):
+    generator = ExcelReportGenerator(generate_findings(450))
+    if split:
+        generator.configure_detail_split(**split)
+    output = str(tmp_path / name / "report.xlsx")
+    os.makedirs(os.path.dirname(output))
+    generator.create_report(output, streaming=streaming, processes=processes)
+    return output, generator.linked_workbooks
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("split", [{}, {'max_rows': 100}, {'max_rows': 40, 'by': "menu"},
+                                   {'max_rows': 200, 'workbooks': True}])
+def test_parallel_matches_serial(tmp_path, streaming, split):
+    serial, serial_linked = _render(tmp_path, "serial", None, streaming, **split)
+    parallel, parallel_linked = _render(tmp_path, "parallel", 2, streaming, **split)
+
+    serial_parts = _parts(serial)
+    parallel_parts = _parts(parallel)
+    sheets = sorted(name for name in serial_parts if name.startswith("xl/worksheets/"))
+    assert sheets == sorted(name for name in parallel_parts if name.startswith("xl/worksheets/"))
+    for name in sheets + ["xl/styles.xml"]:
+        assert serial_parts[name] == parallel_parts[name], name
+
+    # 시트 이름/순서와 시트별 정의된 이름(자동 필터)
+    names = re.compile(rb"<(?:sheet|definedName) [^>]*>[^<]*")
+    assert names.findall(serial_parts["xl/workbook.xml"]) == names.findall(parallel_parts["xl/workbook.xml"])
+
+    assert [os.path.basename(path) for path in serial_linked] == \
+        [os.path.basename(path) for path in parallel_linked]
+    for serial_file, parallel_file in zip(serial_linked, parallel_linked):
+        assert _parts(serial_file) == _parts(parallel_file)
+
+
+def test_assemble_rejects_shared_strings(tmp_path):
+    part = str(tmp_path / "part.xlsx")
+    ExcelReportGenerator(generate_findings(5)).create_report(part, sheets=["summary"])
+    with zipfile.ZipFile(part, "a") as archive:
+        archive.writestr("xl/sharedStrings.xml", "<sst/>")
+    with pytest.raises(ValueError, match="sharedStrings"):
+        assemble_workbook([part], str(tmp_path / "out.xlsx"))